@@ -1,9 +1,12 @@
 import os
 import shutil
 import datetime
+import multiprocessing
 from src.pdfgen import generate_invoice_pdf
 import sqlite3
-from typing import List, Dict
+from contextlib import closing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, List, Dict, Optional
 
 BASE_DIR = os.path.dirname(__file__)
 DATA_DIR = os.path.join(BASE_DIR, "..", "data")
@@ -16,16 +19,38 @@ os.makedirs(BACKUP_DIR, exist_ok=True)
 # ---------------------------
 # Backup SQLite database
 # ---------------------------
-def backup_database():
-    """Create a timestamped backup of the SQLite DB."""
+# Pages copied per step of the online backup; progress is reported between steps.
+BACKUP_PAGES_PER_STEP = 1024
+
+
+def backup_database(progress: Optional[Callable[[int], None]] = None):
+    """
+    Create a timestamped backup of the SQLite DB using SQLite's online
+    backup API, so a consistent copy is taken even while the app holds the
+    database open. ``progress`` receives the percentage copied so far.
+    """
     if not os.path.exists(DB_FILE):
         raise FileNotFoundError("Database file not found.")
     
     ts = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
     backup_name = f"invoices_backup_{ts}.db"
     backup_path = os.path.join(BACKUP_DIR, backup_name)
-    
-    shutil.copy2(DB_FILE, backup_path)
+
+    def _on_step(status, remaining, total):
+        if progress and total:
+            progress(int((total - remaining) * 100 / total))
+
+    try:
+        with closing(sqlite3.connect(DB_FILE)) as src, closing(sqlite3.connect(backup_path)) as dst:
+            src.backup(dst, pages=BACKUP_PAGES_PER_STEP, progress=_on_step)
+    except sqlite3.Error:
+        # Don't leave a half-written backup behind
+        if os.path.exists(backup_path):
+            os.remove(backup_path)
+        raise
+
+    if progress:
+        progress(100)
     print(f"✅ Database backup created: {backup_path}")
     return backup_path
 
@@ -45,8 +70,29 @@ def restore_database(backup_file: str):
 # --------------------------
 # Invoice regeneration utility
 # --------------------------
-def regenerate_all_pdfs(output_dir=None) -> List[str]:
-    """Recreate PDF files for all invoices from DB (useful after layout updates)."""
+# Below this many invoices the cost of starting worker processes outweighs
+# rendering them one after another.
+PARALLEL_MIN_INVOICES = 4
+
+
+def count_invoices() -> int:
+    """Number of invoices regenerate_all_pdfs will render."""
+    with closing(sqlite3.connect(DB_FILE)) as conn:
+        return conn.execute("SELECT COUNT(*) FROM invoices").fetchone()[0]
+
+
+def _render_one(inv: Dict, items: List[Dict], file_path: str) -> str:
+    """Render a single invoice PDF (runs inside a worker process)."""
+    generate_invoice_pdf(inv, items, file_path)
+    return file_path
+
+
+def regenerate_all_pdfs(output_dir=None, progress: Optional[Callable[[int], None]] = None) -> List[str]:
+    """
+    Recreate PDF files for all invoices from DB (useful after layout updates).
+    Invoices are rendered in parallel across CPU cores; ``progress`` is called
+    with the number of finished PDFs as they complete.
+    """
     if output_dir is None:
         output_dir = os.path.join(DATA_DIR, "pdf_exports")
     os.makedirs(output_dir, exist_ok=True)
@@ -54,25 +100,45 @@ def regenerate_all_pdfs(output_dir=None) -> List[str]:
     conn = sqlite3.connect(DB_FILE)
     conn.row_factory = sqlite3.Row
     
-    pdf_paths = []
-    invoices = conn.execute("SELECT * FROM invoices").fetchall()
-    for inv_row in invoices:
-        inv = dict(inv_row)
-        inv_id = inv_row["id"]
-        
-        items = [
-            dict(r)
-            for r in conn.execute(
-                "SELECT * FROM invoice_items WHERE invoice_id=?", (inv_id,)
-            )
-        ]
-        
-        file_name = f"Invoice_{inv['invoice_no']}.pdf"
-        file_path = os.path.join(output_dir, file_name)
-        generate_invoice_pdf(inv, items, file_path)
-        pdf_paths.append(file_path)
-        
-    conn.close()
+    jobs = []
+    try:
+        invoices = conn.execute("SELECT * FROM invoices").fetchall()
+        for inv_row in invoices:
+            inv = dict(inv_row)
+            inv_id = inv_row["id"]
+
+            items = [
+                dict(r)
+                for r in conn.execute(
+                    "SELECT * FROM invoice_items WHERE invoice_id=?", (inv_id,)
+                )
+            ]
+
+            file_name = f"Invoice_{inv['invoice_no']}.pdf"
+            jobs.append((inv, items, os.path.join(output_dir, file_name)))
+    finally:
+        conn.close()
+
+    if len(jobs) < PARALLEL_MIN_INVOICES:
+        pdf_paths = []
+        for done, job in enumerate(jobs, 1):
+            pdf_paths.append(_render_one(*job))
+            if progress is not None:
+                progress(done)
+    else:
+        # "spawn" everywhere: forking this multithreaded Qt process from a
+        # pool thread can deadlock, and frozen Windows builds spawn anyway.
+        ctx = multiprocessing.get_context("spawn")
+        # Windows caps worker processes at 61; never start more than the jobs need
+        workers = min(os.cpu_count() or 1, 61, len(jobs))
+        with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as ex:
+            futures = [ex.submit(_render_one, *job) for job in jobs]
+            for done, _ in enumerate(as_completed(futures), 1):
+                if progress is not None:
+                    progress(done)
+            # Keep the original invoice order in the result
+            pdf_paths = [f.result() for f in futures]
+
     print(f"✅ {len(pdf_paths)} invoices regenerated in {output_dir}")
     return pdf_paths
 
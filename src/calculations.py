@@ -13,6 +13,25 @@ def _money(value) -> Decimal:
         return Decimal("0.00")
 
 
+def _cents(value) -> int:
+    """
+    Convert a number into whole cents, rounded exactly like _money().
+    """
+    if isinstance(value, int):
+        return value * 100
+    return int(_money(value).scaleb(2))
+
+
+def _div_round(numerator: int, denominator: int) -> int:
+    """
+    Integer division rounded half-to-even (Decimal's default), denominator > 0.
+    """
+    q, r = divmod(numerator, denominator)
+    if 2 * r > denominator or (2 * r == denominator and q & 1):
+        q += 1
+    return q
+
+
 # -------------------------------
 # Item Calculation
 # -------------------------------
@@ -71,6 +90,45 @@ def summarize_invoice(items):
     }
 
 
+def summarize_invoice_bulk(qtys, unit_prices, sales_tax_percent=18, advance_tax_percent=0.5):
+    """
+    Compute invoice totals straight from parallel sequences of quantities
+    and unit prices, without building a calculate_item() dict per row.
+    Gives the same result as summarize_invoice() over calculate_item() rows.
+    Amounts are kept as integer cents and turned into Decimal once at the end.
+    """
+    # Tax percentages as exact ratios applied to cents: pct / 100
+    sales_num, sales_den = (Decimal(str(sales_tax_percent)) / 100).as_integer_ratio()
+    adv_num, adv_den = (Decimal(str(advance_tax_percent)) / 100).as_integer_ratio()
+
+    subtotal = 0
+    sales_tax_total = 0
+    advance_tax_total = 0
+    total_qty_pieces = 0
+
+    for qty, unit_price in zip(qtys, unit_prices):
+        price = _cents(unit_price)
+        if isinstance(qty, int):
+            value = qty * price
+        else:
+            qty = Decimal(str(qty))
+            qty_num, qty_den = qty.as_integer_ratio()
+            value = _div_round(qty_num * price, qty_den)
+
+        subtotal += value
+        sales_tax_total += _div_round(value * sales_num, sales_den)
+        advance_tax_total += _div_round(value * adv_num, adv_den)
+        total_qty_pieces += qty
+
+    return {
+        "subtotal": Decimal(subtotal).scaleb(-2),
+        "sales_tax_total": Decimal(sales_tax_total).scaleb(-2),
+        "advance_tax_total": Decimal(advance_tax_total).scaleb(-2),
+        "grand_total": Decimal(subtotal + sales_tax_total + advance_tax_total).scaleb(-2),
+        "total_qty_pieces": int(total_qty_pieces),
+    }
+
+
 # -------------------------------
 # Invoice Number Generation
 # -------------------------------
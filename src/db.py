@@ -1,6 +1,8 @@
 import os
 import sqlite3
 import logging
+import threading
+from collections import OrderedDict
 from typing import List, Dict, Any, Optional
 
 # -----------------------------------------
@@ -10,6 +12,17 @@ BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DB_PATH = os.path.join(BASE_DIR, "..", "data", "invoices.db")
 SCHEMA_PATH = os.path.join(BASE_DIR, "db_schema.sql")
 
+# Process-wide connections, one per database file. Every Database instance
+# pointing at the same file shares it, so sqlite's per-connection statement
+# cache is reused instead of re-parsing the same SQL on each new form.
+# These belong to the UI thread; pool threads use Database.for_thread().
+_CONNECTIONS: Dict[str, sqlite3.Connection] = {}
+_CONN_LOCK = threading.Lock()
+
+# Database files whose products_fts index was created successfully
+# (FTS5 with the trigram tokenizer needs SQLite >= 3.34).
+_FTS_READY: Dict[str, bool] = {}
+
 
 class Database:
     """
@@ -25,21 +38,108 @@ class Database:
     Also handles invoice search and PDF path storage.
     """
 
-    def __init__(self, db_path: str = DB_PATH):
-        self.db_path = os.path.abspath(db_path)
+    _instance: Optional["Database"] = None
 
-        # Ensure /data directory exists
-        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+    # Kept as constants so the SQL text is identical on every call and
+    # sqlite3's statement cache serves the compiled statement.
+    _SEARCH_PRODUCTS_SQL = """
+        SELECT *
+        FROM products
+        WHERE (name LIKE ? OR description LIKE ? OR sku LIKE ? OR barcode LIKE ?)
+          AND active=1
+        ORDER BY name ASC
+    """
 
-        # Connect and set row_factory so rows behave like dicts
-        # Set a higher timeout to avoid "database is locked" in case of concurrency
-        self.conn = sqlite3.connect(self.db_path, timeout=20)
-        self.conn.row_factory = sqlite3.Row
-        self.conn.execute("PRAGMA foreign_keys = ON")
+    _SEARCH_PRODUCTS_FTS_SQL = """
+        SELECT p.*
+        FROM products_fts f
+        JOIN products p ON p.id = f.rowid
+        WHERE products_fts MATCH ?
+          AND p.active=1
+        ORDER BY p.name ASC
+    """
 
-        # Load schema if tables do not exist and ensure migrations
-        self.initialize_schema()
-        self.ensure_schema_migrations()
+    _INVOICES_SQL = """
+        SELECT i.*, c.name AS customer_name
+        FROM invoices i
+        LEFT JOIN customers c ON i.customer_id = c.id
+        ORDER BY i.date DESC, i.id DESC
+        LIMIT ? OFFSET ?
+    """
+
+    _SEARCH_INVOICES_SQL = """
+        SELECT i.*, c.name AS customer_name
+        FROM invoices i
+        LEFT JOIN customers c ON i.customer_id = c.id
+        WHERE i.invoice_no LIKE ?
+           OR c.name LIKE ?
+        ORDER BY i.date DESC, i.id DESC
+        LIMIT ? OFFSET ?
+    """
+
+    _COUNT_INVOICES_SQL = "SELECT COUNT(*) AS n FROM invoices"
+
+    _COUNT_SEARCH_INVOICES_SQL = """
+        SELECT COUNT(*) AS n
+        FROM invoices i
+        LEFT JOIN customers c ON i.customer_id = c.id
+        WHERE i.invoice_no LIKE ?
+           OR c.name LIKE ?
+    """
+
+    INVOICE_CACHE_SIZE = 64
+
+    def __init__(self, db_path: str = DB_PATH):
+        self.db_path = os.path.abspath(db_path)
+        # Invoice list/search/count results for this instance, keyed by
+        # (statement, params). Cleared on every write made through it.
+        self._invoice_cache = OrderedDict()
+
+        with _CONN_LOCK:
+            conn = _CONNECTIONS.get(self.db_path)
+            if conn is not None:
+                self.conn = conn
+                return
+
+            # Ensure /data directory exists
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+
+            # Connect and set row_factory so rows behave like dicts
+            # Set a higher timeout to avoid "database is locked" in case of concurrency.
+            self.conn = sqlite3.connect(self.db_path, timeout=20)
+            self.conn.row_factory = sqlite3.Row
+            self.conn.execute("PRAGMA foreign_keys = ON")
+            # ~20 MB page cache (negative values are KiB)
+            self.conn.execute("PRAGMA cache_size = -20000")
+
+            # Load schema if tables do not exist and ensure migrations
+            self.initialize_schema()
+            self.ensure_schema_migrations()
+
+            _CONNECTIONS[self.db_path] = self.conn
+
+    @classmethod
+    def for_thread(cls, db_path: str = DB_PATH) -> "Database":
+        """
+        Return a Database on a private connection for use on a worker thread.
+        sqlite3 connections must not be shared across threads, so this one is
+        not registered; the caller closes it with ``close()`` when done.
+        Schema setup is left to the shared (UI thread) connection.
+        """
+        db = cls.__new__(cls)
+        db.db_path = os.path.abspath(db_path)
+        db._invoice_cache = OrderedDict()
+        db.conn = sqlite3.connect(db.db_path, timeout=20)
+        db.conn.row_factory = sqlite3.Row
+        db.conn.execute("PRAGMA foreign_keys = ON")
+        return db
+
+    @classmethod
+    def instance(cls) -> "Database":
+        """Return the process-wide Database for the default DB_PATH."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
 
     # ---------------------------------------------------------
     # Schema Initialization
@@ -59,6 +159,7 @@ class Database:
         """Apply lightweight migrations that CREATE TABLE IF NOT EXISTS cannot cover."""
         self._ensure_product_identifiers()
         self._ensure_invoice_shipped_to()
+        self._ensure_products_fts()
 
     def _ensure_product_identifiers(self):
         """Add SKU / barcode columns if the database was created before they existed."""
@@ -86,11 +187,56 @@ class Database:
             self.conn.execute("ALTER TABLE invoices ADD COLUMN shipped_to TEXT")
             self.conn.commit()
 
+    def _ensure_products_fts(self):
+        """
+        Maintain a trigram FTS5 index over the searchable product columns.
+        Trigram matching keeps the substring semantics of the LIKE search.
+        """
+        exists = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='products_fts'"
+        ).fetchone()
+        try:
+            self.conn.executescript(
+                """
+                CREATE VIRTUAL TABLE IF NOT EXISTS products_fts USING fts5(
+                    name, sku, barcode, description,
+                    content='products', content_rowid='id', tokenize='trigram'
+                );
+
+                CREATE TRIGGER IF NOT EXISTS products_fts_ai AFTER INSERT ON products BEGIN
+                    INSERT INTO products_fts(rowid, name, sku, barcode, description)
+                    VALUES (new.id, new.name, new.sku, new.barcode, new.description);
+                END;
+
+                CREATE TRIGGER IF NOT EXISTS products_fts_ad AFTER DELETE ON products BEGIN
+                    INSERT INTO products_fts(products_fts, rowid, name, sku, barcode, description)
+                    VALUES ('delete', old.id, old.name, old.sku, old.barcode, old.description);
+                END;
+
+                CREATE TRIGGER IF NOT EXISTS products_fts_au AFTER UPDATE ON products BEGIN
+                    INSERT INTO products_fts(products_fts, rowid, name, sku, barcode, description)
+                    VALUES ('delete', old.id, old.name, old.sku, old.barcode, old.description);
+                    INSERT INTO products_fts(rowid, name, sku, barcode, description)
+                    VALUES (new.id, new.name, new.sku, new.barcode, new.description);
+                END;
+                """
+            )
+            if not exists:
+                # Index rows that predate the FTS table
+                self.conn.execute("INSERT INTO products_fts(products_fts) VALUES ('rebuild')")
+            self.conn.commit()
+            _FTS_READY[self.db_path] = True
+        except sqlite3.OperationalError as e:
+            # FTS5 / trigram not compiled in: search_products falls back to LIKE
+            logging.warning(f"Product FTS index unavailable: {e}")
+            _FTS_READY[self.db_path] = False
+
     # ---------------------------------------------------------
     # Generic Helpers
     # ---------------------------------------------------------
     def execute(self, query: str, params: tuple = ()):
         """Execute INSERT/UPDATE/DELETE and commit."""
+        self._invoice_cache.clear()
         try:
             cur = self.conn.cursor()
             cur.execute(query, params)
@@ -266,17 +412,13 @@ class Database:
         )
 
     def search_products(self, query: str) -> List[Dict[str, Any]]:
+        # Trigrams need at least 3 characters; shorter queries use LIKE
+        if _FTS_READY.get(self.db_path) and len(query) >= 3:
+            phrase = '"' + query.replace('"', '""') + '"'
+            return self.fetch_all(self._SEARCH_PRODUCTS_FTS_SQL, (phrase,))
+
         q = f"%{query}%"
-        return self.fetch_all(
-            """
-            SELECT *
-            FROM products
-            WHERE (name LIKE ? OR description LIKE ? OR sku LIKE ? OR barcode LIKE ?)
-              AND active=1
-            ORDER BY name ASC
-            """,
-            (q, q, q, q),
-        )
+        return self.fetch_all(self._SEARCH_PRODUCTS_SQL, (q, q, q, q))
 
     def delete_product(self, product_id: int):
         """Soft delete: set active=0 instead of hard delete."""
@@ -368,8 +510,35 @@ class Database:
 
     def add_invoice_items(self, invoice_id: int, items: List[Dict[str, Any]]):
         """Insert line items for an invoice."""
-        for item in items:
-            self.execute(
+        rows = [
+            (
+                invoice_id,
+                item.get("product_id"),
+                item.get("description"),
+                float(item.get("qty", 0)),
+                float(item.get("unit_price", 0)),
+                float(item.get("value", 0)),
+                float(item.get("sales_tax_amount", 0)),
+                float(item.get("advance_tax_amount", 0)),
+                float(item.get("total_amount", 0)),
+            )
+            for item in items
+        ]
+        self.add_invoice_items_bulk(rows)
+
+    def add_invoice_items_bulk(self, rows: List[tuple]):
+        """
+        Insert pre-built line item tuples with a single executemany
+        so the INSERT is prepared once. Tuples are in column order:
+        (invoice_id, product_id, description, qty, unit_price, value,
+         sales_tax_amount, advance_tax_amount, total_amount)
+        """
+        if not rows:
+            return
+        self._invoice_cache.clear()
+        try:
+            cur = self.conn.cursor()
+            cur.executemany(
                 """
                 INSERT INTO invoice_items (
                     invoice_id, product_id, description, qty,
@@ -378,18 +547,13 @@ class Database:
                 )
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
-                (
-                    invoice_id,
-                    item.get("product_id"),
-                    item.get("description"),
-                    float(item.get("qty", 0)),
-                    float(item.get("unit_price", 0)),
-                    float(item.get("value", 0)),
-                    float(item.get("sales_tax_amount", 0)),
-                    float(item.get("advance_tax_amount", 0)),
-                    float(item.get("total_amount", 0)),
-                ),
+                rows,
             )
+            self.conn.commit()
+        except sqlite3.Error as e:
+            self.conn.rollback()
+            logging.error(f"DB ExecuteMany Error: {e} | Rows: {len(rows)}")
+            raise
 
     def create_invoice_with_items(self, invoice_data, items) -> int:
         """
@@ -413,32 +577,49 @@ class Database:
     # ---------------------------------------------------------
     # Invoice Retrieval & Search
     # ---------------------------------------------------------
-    def get_invoices(self) -> List[Dict[str, Any]]:
-        """Return all invoices with customer name."""
-        return self.fetch_all(
-            """
-            SELECT i.*, c.name AS customer_name
-            FROM invoices i
-            LEFT JOIN customers c ON i.customer_id = c.id
-            ORDER BY date DESC
-            """
+    def _cached_invoice_query(self, sql: str, params: tuple, one: bool = False):
+        cache = self._invoice_cache
+        key = (sql, params)
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+
+        result = self.fetch_one(sql, params) if one else self.fetch_all(sql, params)
+        cache[key] = result
+        if len(cache) > self.INVOICE_CACHE_SIZE:
+            cache.popitem(last=False)
+        return result
+
+    def clear_invoice_cache(self):
+        """Drop cached invoice results, e.g. after changes made elsewhere."""
+        self._invoice_cache.clear()
+
+    def get_invoices(self, limit: Optional[int] = None, offset: int = 0) -> List[Dict[str, Any]]:
+        """Return invoices with customer name, newest first (optionally one page)."""
+        return self._cached_invoice_query(
+            self._INVOICES_SQL, (-1 if limit is None else limit, offset)
         )
 
-    def search_invoices(self, query: str) -> List[Dict[str, Any]]:
-        """Search by invoice number OR customer name."""
+    def search_invoices(
+        self, query: str, limit: Optional[int] = None, offset: int = 0
+    ) -> List[Dict[str, Any]]:
+        """Search by invoice number OR customer name (optionally one page)."""
         q = f"%{query}%"
-        return self.fetch_all(
-            """
-            SELECT i.*, c.name AS customer_name
-            FROM invoices i
-            LEFT JOIN customers c ON i.customer_id = c.id
-            WHERE i.invoice_no LIKE ?
-               OR c.name LIKE ?
-            ORDER BY i.date DESC
-            """,
-            (q, q),
+        return self._cached_invoice_query(
+            self._SEARCH_INVOICES_SQL, (q, q, -1 if limit is None else limit, offset)
         )
 
+    def count_invoices(self, query: str = "") -> int:
+        """Count invoices matching the same filter as search_invoices."""
+        if not query:
+            row = self._cached_invoice_query(self._COUNT_INVOICES_SQL, (), one=True)
+        else:
+            q = f"%{query}%"
+            row = self._cached_invoice_query(
+                self._COUNT_SEARCH_INVOICES_SQL, (q, q), one=True
+            )
+        return row["n"] if row else 0
+
     def get_invoice(self, invoice_id: int) -> Optional[Dict[str, Any]]:
         """Get invoice header with joined customer data."""
         return self.fetch_one(
@@ -496,7 +677,13 @@ class Database:
     # Cleanup
     # ---------------------------------------------------------
     def close(self):
+        """Close the shared connection for this file; the next Database() reopens it."""
         if self.conn:
+            with _CONN_LOCK:
+                if _CONNECTIONS.get(self.db_path) is self.conn:
+                    del _CONNECTIONS[self.db_path]
+            if Database._instance is self:
+                Database._instance = None
             self.conn.close()
 
 
@@ -58,6 +58,8 @@ CREATE TABLE IF NOT EXISTS invoices (
     FOREIGN KEY (company_id) REFERENCES company(id)
 );
 
+CREATE INDEX IF NOT EXISTS idx_invoices_date ON invoices(date);
+
 -- =========================
 --  INVOICE ITEMS
 -- =========================
@@ -76,6 +78,8 @@ CREATE TABLE IF NOT EXISTS invoice_items (
     FOREIGN KEY (product_id) REFERENCES products(id)
 );
 
+CREATE INDEX IF NOT EXISTS idx_invoice_items_invoice ON invoice_items(invoice_id);
+
 -- =========================
 --  SETTINGS
 -- =========================
@@ -98,4 +102,32 @@ CREATE TABLE IF NOT EXISTS customer_product_prices (
     FOREIGN KEY (product_id) REFERENCES products(id) ON DELETE CASCADE
 );
 
+-- =========================
+--  SUMMARY CACHE
+-- =========================
+CREATE TABLE IF NOT EXISTS summary_cache (
+    period_start TEXT NOT NULL,
+    period_end TEXT NOT NULL,
+    stamp TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (period_start, period_end)
+);
+
+-- Cached reports show customer/product names, which the range stamp
+-- does not cover; drop the cache when one changes.
+CREATE TRIGGER IF NOT EXISTS summary_cache_customer_au AFTER UPDATE OF name ON customers BEGIN
+    DELETE FROM summary_cache;
+END;
+
+CREATE TRIGGER IF NOT EXISTS summary_cache_customer_ad AFTER DELETE ON customers BEGIN
+    DELETE FROM summary_cache;
+END;
+
+CREATE TRIGGER IF NOT EXISTS summary_cache_product_au AFTER UPDATE OF name ON products BEGIN
+    DELETE FROM summary_cache;
+END;
 
+CREATE TRIGGER IF NOT EXISTS summary_cache_product_ad AFTER DELETE ON products BEGIN
+    DELETE FROM summary_cache;
+END;
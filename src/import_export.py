@@ -1,8 +1,10 @@
 import csv
+import io
 import os
 import sqlite3
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Callable, Optional
 from contextlib import closing
+from itertools import islice
 
 BASE_DIR = os.path.dirname(__file__)
 DATA_DIR = os.path.join(BASE_DIR, "..", "data")
@@ -13,119 +15,249 @@ def _connect() -> sqlite3.Connection:
     conn.row_factory = sqlite3.Row
     return conn
 
+EXPORT_CHUNK_SIZE = 5000
+EXPORT_BUFFER_SIZE = 4 << 20  # large writes are much kinder to network shares
+
+
+def _open_export_file(output_path: str) -> io.TextIOWrapper:
+    """
+    Open ``output_path`` for CSV writing behind a 4 MB binary buffer. On
+    Windows the file is also opened with O_SEQUENTIAL as a caching hint.
+    """
+    flags = (
+        os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+        | getattr(os, "O_BINARY", 0) | getattr(os, "O_SEQUENTIAL", 0)
+    )
+    fd = os.open(output_path, flags, 0o666)
+    try:
+        raw = open(fd, "wb", buffering=EXPORT_BUFFER_SIZE)
+    except BaseException:
+        os.close(fd)
+        raise
+    try:
+        return io.TextIOWrapper(raw, encoding="utf-8", newline="")
+    except BaseException:
+        raw.close()  # also closes fd
+        raise
+
+
 def export_to_csv(table_name: str, output_path: str):
     """Export a table to a CSV file."""
-    with closing(_connect()) as conn:
+    export_to_csv_streaming(table_name, output_path)
+
+
+def export_to_csv_streaming(table_name: str, output_path: str, chunk: int = EXPORT_CHUNK_SIZE):
+    """
+    Export a table to CSV in batches of ``chunk`` rows, so memory stays
+    bounded by one batch no matter how large the table is.
+    """
+    with closing(sqlite3.connect(DB_FILE)) as conn:
         cursor = conn.execute(f"SELECT * FROM {table_name}")
-        rows = cursor.fetchall()
-        if not rows:
-            return
-        
-        headers = rows[0].keys()
-        
-        with open(output_path, 'w', newline='', encoding='utf-8') as f:
+        cursor.arraysize = chunk
+        headers = [col[0] for col in cursor.description]
+
+        with _open_export_file(output_path) as f:
             writer = csv.writer(f)
             writer.writerow(headers)
-            for row in rows:
-                writer.writerow(list(row))
+            while True:
+                rows = cursor.fetchmany()
+                if not rows:
+                    break
+                writer.writerows(rows)
 
-def import_customers_from_csv(csv_path: str) -> int:
-    """Import customers from CSV. Updates existing by name or inserts new."""
+_UPDATE_CUSTOMER_SQL = """
+    UPDATE customers SET
+        address=?, ntn=?, strn=?, contact=?, email=?
+    WHERE id=?
+"""
+
+_INSERT_CUSTOMER_SQL = """
+    INSERT INTO customers (name, address, ntn, strn, contact, email)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+_UPDATE_PRODUCT_SQL = """
+    UPDATE products SET
+        description=?, sku=?, barcode=?, unit_price=?, tax_rate=?, active=?
+    WHERE id=?
+"""
+
+_INSERT_PRODUCT_SQL = """
+    INSERT INTO products (name, description, sku, barcode, unit_price, tax_rate, active)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+IMPORT_BATCH_SIZE = 1000
+PROGRESS_EVERY = 100
+
+ProgressCallback = Optional[Callable[[int], None]]
+
+
+class CsvImportError(ValueError):
+    """A CSV row failed validation; nothing from the file was imported."""
+
+    def __init__(self, line: int, message: str):
+        super().__init__(f"Row {line}: {message}")
+        self.line = line
+
+
+def _ids_by_name(conn: sqlite3.Connection, table_name: str) -> Dict[str, int]:
+    """Map each name to its first (lowest id) row, as the per-row lookup did."""
+    ids: Dict[str, int] = {}
+    for row in conn.execute(f"SELECT id, name FROM {table_name} ORDER BY id"):
+        ids.setdefault(row["name"], row["id"])
+    return ids
+
+
+def _executemany_batched(conn: sqlite3.Connection, sql: str, rows, size: int = IMPORT_BATCH_SIZE):
+    it = iter(rows)
+    while True:
+        batch = list(islice(it, size))
+        if not batch:
+            break
+        conn.executemany(sql, batch)
+
+
+def _upsert_by_name(
+    conn: sqlite3.Connection,
+    table_name: str,
+    parsed_rows,
+    update_sql: str,
+    insert_sql: str,
+    progress: ProgressCallback = None,
+) -> int:
+    """
+    Apply ``(name, values)`` pairs in one transaction: rows whose name
+    already exists update that record, the rest are inserted. Statements
+    go through executemany in batches of IMPORT_BATCH_SIZE. ``progress``
+    is called with the number of rows read every PROGRESS_EVERY rows.
+
+    The import is all-or-nothing: any error (e.g. a CsvImportError raised
+    while parsing) rolls back every row written so far.
+    """
     count = 0
+    updates = []
+    inserts: Dict[str, tuple] = {}  # new names; a repeated name keeps its last values
+
+    conn.execute("PRAGMA synchronous = NORMAL")
+    try:
+        # Take the write lock up front so the name lookup stays valid
+        conn.execute("BEGIN IMMEDIATE")
+        existing = _ids_by_name(conn, table_name)
+        for name, values in parsed_rows:
+            row_id = existing.get(name)
+            if row_id is not None:
+                updates.append(values + (row_id,))
+                if len(updates) >= IMPORT_BATCH_SIZE:
+                    conn.executemany(update_sql, updates)
+                    updates.clear()
+            else:
+                inserts[name] = (name,) + values
+            count += 1
+            if progress is not None and count % PROGRESS_EVERY == 0:
+                progress(count)
+        if updates:
+            conn.executemany(update_sql, updates)
+        _executemany_batched(conn, insert_sql, inserts.values())
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    return count
+
+
+def _column_getter(header: List[str]):
+    """
+    Resolve column positions once from the header row and return a
+    ``get(row, name, default)`` accessor with DictReader semantics: a
+    missing column yields ``default``, a short row yields None.
+    """
+    idx = {name: i for i, name in enumerate(header)}
+
+    def get(row: List[str], name: str, default=''):
+        i = idx.get(name)
+        if i is None:
+            return default
+        return row[i] if i < len(row) else None
+
+    return get
+
+
+def _parse_customer_rows(reader):
+    header = next(reader, None)
+    if header is None:
+        return
+    get = _column_getter(header)
+    for row in reader:
+        if not row:
+            continue
+        # Basic upsert based on name
+        name = get(row, 'name', None)
+        if not name:
+            continue
+        yield name, (
+            get(row, 'address'),
+            get(row, 'ntn'),
+            get(row, 'strn'),
+            get(row, 'contact'),
+            get(row, 'email'),
+        )
+
+
+def _to_float(value, column: str, line: int) -> float:
+    """Blank means 0; anything else must be a number."""
+    if value is None or not str(value).strip():
+        return 0.0
+    try:
+        return float(value)
+    except ValueError:
+        raise CsvImportError(line, f"{column} must be a number, got {value!r}") from None
+
+
+def _parse_product_rows(reader):
+    header = next(reader, None)
+    if header is None:
+        return
+    get = _column_getter(header)
+    for row in reader:
+        if not row:
+            continue
+        name = get(row, 'name', None)
+        if not name:
+            continue
+
+        active = 1
+        raw_active = get(row, 'active', None)
+        if raw_active and raw_active.lower() in ('0', 'false', 'no'):
+            active = 0
+
+        yield name, (
+            get(row, 'description'),
+            get(row, 'sku'),
+            get(row, 'barcode'),
+            _to_float(get(row, 'unit_price', 0), 'unit_price', reader.line_num),
+            _to_float(get(row, 'tax_rate', 0), 'tax_rate', reader.line_num),
+            active,
+        )
+
+
+def import_customers_from_csv(csv_path: str, progress: ProgressCallback = None) -> int:
+    """Import customers from CSV. Updates existing by name or inserts new."""
     with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
+        reader = csv.reader(f)
         with closing(_connect()) as conn:
-            for row in reader:
-                # Basic upsert based on name
-                name = row.get('name')
-                if not name:
-                    continue
-                
-                exists = conn.execute("SELECT id FROM customers WHERE name = ?", (name,)).fetchone()
-                if exists:
-                    conn.execute("""
-                        UPDATE customers SET 
-                            address=?, ntn=?, strn=?, contact=?, email=?
-                        WHERE id=?
-                    """, (
-                        row.get('address', ''),
-                        row.get('ntn', ''),
-                        row.get('strn', ''),
-                        row.get('contact', ''),
-                        row.get('email', ''),
-                        exists['id']
-                    ))
-                else:
-                    conn.execute("""
-                        INSERT INTO customers (name, address, ntn, strn, contact, email)
-                        VALUES (?, ?, ?, ?, ?, ?)
-                    """, (
-                        name,
-                        row.get('address', ''),
-                        row.get('ntn', ''),
-                        row.get('strn', ''),
-                        row.get('contact', ''),
-                        row.get('email', '')
-                    ))
-                count += 1
-            conn.commit()
-    return count
+            return _upsert_by_name(
+                conn, "customers", _parse_customer_rows(reader),
+                _UPDATE_CUSTOMER_SQL, _INSERT_CUSTOMER_SQL, progress,
+            )
+
 
-def import_products_from_csv(csv_path: str) -> int:
+def import_products_from_csv(csv_path: str, progress: ProgressCallback = None) -> int:
     """Import products from CSV. Updates existing by name or inserts new."""
-    count = 0
     with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
+        reader = csv.reader(f)
         with closing(_connect()) as conn:
-            for row in reader:
-                name = row.get('name')
-                if not name:
-                    continue
-                
-                exists = conn.execute("SELECT id FROM products WHERE name = ?", (name,)).fetchone()
-                
-                # Handle numeric fields safely
-                try:
-                    unit_price = float(row.get('unit_price', 0))
-                except ValueError:
-                    unit_price = 0.0
-                    
-                try:
-                    tax_rate = float(row.get('tax_rate', 0))
-                except ValueError:
-                    tax_rate = 0.0
-                    
-                active = 1
-                if row.get('active') and str(row.get('active')).lower() in ['0', 'false', 'no']:
-                    active = 0
-
-                if exists:
-                    conn.execute("""
-                        UPDATE products SET 
-                            description=?, sku=?, barcode=?, unit_price=?, tax_rate=?, active=?
-                        WHERE id=?
-                    """, (
-                        row.get('description', ''),
-                        row.get('sku', ''),
-                        row.get('barcode', ''),
-                        unit_price,
-                        tax_rate,
-                        active,
-                        exists['id']
-                    ))
-                else:
-                    conn.execute("""
-                        INSERT INTO products (name, description, sku, barcode, unit_price, tax_rate, active)
-                        VALUES (?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        name,
-                        row.get('description', ''),
-                        row.get('sku', ''),
-                        row.get('barcode', ''),
-                        unit_price,
-                        tax_rate,
-                        active
-                    ))
-                count += 1
-            conn.commit()
-    return count
+            return _upsert_by_name(
+                conn, "products", _parse_product_rows(reader),
+                _UPDATE_PRODUCT_SQL, _INSERT_PRODUCT_SQL, progress,
+            )
@@ -1,6 +1,7 @@
 import sys
 import os
 import logging
+import multiprocessing
 from PySide6.QtWidgets import QApplication
 from src.ui.main_window import MainWindow
 
@@ -27,4 +28,6 @@ def main():
     sys.exit(app.exec())
 
 if __name__ == "__main__":
+    # Needed for process pools (PDF regeneration) in the frozen Windows build
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
@@ -1,8 +1,9 @@
 import os
 import sqlite3
 import csv
+import json
+import logging
 from datetime import datetime
-from decimal import Decimal
 from typing import Dict, List, Tuple
 
 from openpyxl import Workbook
@@ -14,18 +15,37 @@ Summary = Dict[str, float]
 InvoiceRow = Dict[str, str]
 
 
-def _fetch_quantity_map(conn: sqlite3.Connection, invoice_ids: List[int]) -> Dict[int, Decimal]:
-    if not invoice_ids:
-        return {}
-    placeholders = ",".join("?" for _ in invoice_ids)
-    query = f"""
-        SELECT invoice_id, COALESCE(SUM(qty), 0) AS qty_sum
-          FROM invoice_items
-         WHERE invoice_id IN ({placeholders})
-         GROUP BY invoice_id
-    """
-    rows = conn.execute(query, invoice_ids).fetchall()
-    return {row["invoice_id"]: Decimal(str(row["qty_sum"])) for row in rows}
+# Per-invoice detail with the item quantity summed in the same statement.
+_SUMMARY_ROWS_SQL = """
+    SELECT i.id,
+           i.invoice_no,
+           i.date,
+           i.subtotal,
+           COALESCE(i.sales_tax, 0)     AS sales_tax_total,
+           COALESCE(i.advance_tax, 0)   AS advance_tax_total,
+           TOTAL(ii.qty)                AS total_quantity
+      FROM invoices i
+      LEFT JOIN invoice_items ii ON ii.invoice_id = i.id
+     WHERE i.date BETWEEN ? AND ?
+     GROUP BY i.id
+     ORDER BY i.date ASC, i.invoice_no ASC
+"""
+
+# Period totals computed by SQLite instead of a Python loop over the rows.
+# Amounts are stored with two decimals, so rounding the sums to cents
+# matches an exact decimal sum.
+_SUMMARY_TOTALS_SQL = """
+    SELECT COUNT(*)                         AS invoice_count,
+           ROUND(TOTAL(i.subtotal), 2)      AS total_sales,
+           ROUND(TOTAL(i.sales_tax), 2)     AS total_sales_tax,
+           ROUND(TOTAL(i.advance_tax), 2)   AS total_advance_tax,
+           (SELECT TOTAL(ii.qty)
+              FROM invoice_items ii
+              JOIN invoices i2 ON i2.id = ii.invoice_id
+             WHERE i2.date BETWEEN ? AND ?) AS total_quantity
+      FROM invoices i
+     WHERE i.date BETWEEN ? AND ?
+"""
 
 
 def fetch_summary(start_date: str, end_date: str) -> Tuple[Summary, List[InvoiceRow]]:
@@ -33,46 +53,22 @@ def fetch_summary(start_date: str, end_date: str) -> Tuple[Summary, List[Invoice
     conn = sqlite3.connect(DB_PATH)
     conn.row_factory = sqlite3.Row
 
-    query = """
-        SELECT i.id,
-               i.invoice_no,
-               i.date,
-               i.subtotal,
-               COALESCE(i.sales_tax, 0)     AS sales_tax_total,
-               COALESCE(i.advance_tax, 0)   AS advance_tax_total
-          FROM invoices i
-         WHERE i.date BETWEEN ? AND ?
-         ORDER BY i.date ASC, i.invoice_no ASC
-    """
     try:
-        rows = [dict(r) for r in conn.execute(query, (start_date, end_date))]
-        qty_map = _fetch_quantity_map(conn, [row["id"] for row in rows])
+        rows = [dict(r) for r in conn.execute(_SUMMARY_ROWS_SQL, (start_date, end_date))]
+        totals = conn.execute(
+            _SUMMARY_TOTALS_SQL, (start_date, end_date, start_date, end_date)
+        ).fetchone()
     finally:
         conn.close()
 
-    total_sales = Decimal("0")
-    total_sales_tax = Decimal("0")
-    total_adv_tax = Decimal("0")
-    total_qty = Decimal("0")
-
-    for inv in rows:
-        inv_id = inv["id"]
-        inv_qty = qty_map.get(inv_id, Decimal("0"))
-        inv["total_quantity"] = float(inv_qty)
-
-        total_sales += Decimal(str(inv.get("subtotal", 0)))
-        total_sales_tax += Decimal(str(inv.get("sales_tax_total", 0)))
-        total_adv_tax += Decimal(str(inv.get("advance_tax_total", 0)))
-        total_qty += inv_qty
-
     summary: Summary = {
         "period_start": start_date,
         "period_end": end_date,
-        "total_sales": float(total_sales),
-        "total_sales_tax": float(total_sales_tax),
-        "total_advance_tax": float(total_adv_tax),
-        "total_quantity": float(total_qty),
-        "invoice_count": len(rows),
+        "total_sales": totals["total_sales"],
+        "total_sales_tax": totals["total_sales_tax"],
+        "total_advance_tax": totals["total_advance_tax"],
+        "total_quantity": totals["total_quantity"],
+        "invoice_count": totals["invoice_count"],
     }
     return summary, rows
 
@@ -127,6 +123,79 @@ def fetch_top_customers(start_date: str, end_date: str, limit: int = 5) -> List[
         conn.close()
 
 
+# --------------------------
+# Persistent summary cache
+# --------------------------
+# Fingerprint of the invoices and their items inside a period; any insert,
+# delete, amount, quantity, customer or product change in the range gives a
+# different stamp. Renaming or deleting a customer/product clears the cache
+# through triggers in db_schema.sql.
+_RANGE_STAMP_SQL = """
+    SELECT inv.*, items.*
+      FROM (SELECT COUNT(*), MAX(id), TOTAL(total_amount), MAX(created_at), TOTAL(customer_id)
+              FROM invoices
+             WHERE date BETWEEN ? AND ?) AS inv,
+           (SELECT COUNT(*), MAX(ii.id), TOTAL(ii.qty), TOTAL(ii.total_amount), TOTAL(ii.product_id)
+              FROM invoice_items ii
+              JOIN invoices i ON i.id = ii.invoice_id
+             WHERE i.date BETWEEN ? AND ?) AS items
+"""
+
+
+def _range_stamp(conn: sqlite3.Connection, start_date: str, end_date: str) -> str:
+    params = (start_date, end_date, start_date, end_date)
+    return json.dumps(list(conn.execute(_RANGE_STAMP_SQL, params).fetchone()))
+
+
+def fetch_summary_bundle(start_date: str, end_date: str) -> Tuple[Summary, List[InvoiceRow], List[Dict], List[Dict]]:
+    """
+    Return (summary, rows, top_products, top_customers) for a period,
+    served from the summary_cache table while the period's invoices are
+    unchanged, so reopening the app does not re-scan them.
+    """
+    conn = sqlite3.connect(DB_PATH)
+    try:
+        try:
+            stamp = _range_stamp(conn, start_date, end_date)
+            cached = conn.execute(
+                "SELECT payload FROM summary_cache WHERE period_start = ? AND period_end = ? AND stamp = ?",
+                (start_date, end_date, stamp),
+            ).fetchone()
+        except sqlite3.Error as exc:
+            logging.warning(f"Summary cache unavailable: {exc}")
+            stamp, cached = None, None
+
+        if cached is not None:
+            summary, rows, top_products, top_customers = json.loads(cached[0])
+            return summary, rows, top_products, top_customers
+
+        summary, rows = fetch_summary(start_date, end_date)
+        top_products = fetch_top_products(start_date, end_date)
+        top_customers = fetch_top_customers(start_date, end_date)
+
+        if stamp is not None:
+            try:
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO summary_cache (period_start, period_end, stamp, payload, updated_at)
+                    VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+                    """,
+                    (
+                        start_date,
+                        end_date,
+                        stamp,
+                        json.dumps([summary, rows, top_products, top_customers]),
+                    ),
+                )
+                conn.commit()
+            except sqlite3.Error as exc:
+                logging.warning(f"Could not store summary cache: {exc}")
+
+        return summary, rows, top_products, top_customers
+    finally:
+        conn.close()
+
+
 # --------------------------
 # CSV export
 # --------------------------
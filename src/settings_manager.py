@@ -14,6 +14,7 @@ import os
 import sqlite3
 from contextlib import closing
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, Optional
 import hashlib
 
@@ -26,6 +27,7 @@ PREF_DEFAULTS = {
     "invoice_sequence": "1",
     "default_pdf_dir": os.path.abspath(DEFAULT_PDF_DIR),
     "auto_open_pdf": "0",
+    "password_set": "0",
 }
 
 
@@ -41,12 +43,13 @@ class CompanyProfile:
     strn: str = ""
 
 
-@dataclass
+@dataclass(frozen=True)
 class Preferences:
     invoice_prefix: str = PREF_DEFAULTS["invoice_prefix"]
     invoice_sequence: int = int(PREF_DEFAULTS["invoice_sequence"])
     default_pdf_dir: str = PREF_DEFAULTS["default_pdf_dir"]
     auto_open_pdf: bool = False
+    password_set: bool = False
 
 
 # --------------------------------------------------------------------------- #
@@ -78,6 +81,7 @@ def set_setting(key: str, value: str) -> None:
             (key, value),
         )
         conn.commit()
+    get_preferences.cache_clear()
 
 
 def get_setting(key: str, default: Optional[str] = None) -> Optional[str]:
@@ -89,7 +93,9 @@ def get_setting(key: str, default: Optional[str] = None) -> Optional[str]:
 # --------------------------------------------------------------------------- #
 # Company profile helpers
 # --------------------------------------------------------------------------- #
+@lru_cache(maxsize=1)
 def get_company_profile() -> CompanyProfile:
+    """Return the company profile, cached until it is saved again."""
     with closing(_connect()) as conn:
         row = conn.execute("SELECT * FROM company LIMIT 1").fetchone()
         if not row:
@@ -135,18 +141,22 @@ def save_company_profile(profile: CompanyProfile) -> None:
                 params,
             )
         conn.commit()
+    get_company_profile.cache_clear()
 
 
 # --------------------------------------------------------------------------- #
 # Preferences helpers
 # --------------------------------------------------------------------------- #
+@lru_cache(maxsize=1)
 def get_preferences() -> Preferences:
+    """Return the preferences, cached until any setting is written."""
     _ensure_defaults()
 
     keys = tuple(PREF_DEFAULTS.keys())
     placeholders = ",".join("?" for _ in keys)
 
     prefs: Dict[str, str] = PREF_DEFAULTS.copy()
+    stored_keys = set()
     if placeholders:
         with closing(_connect()) as conn:
             rows = conn.execute(
@@ -155,12 +165,21 @@ def get_preferences() -> Preferences:
             ).fetchall()
             for row in rows:
                 prefs[row["key"]] = row["value"]
+                stored_keys.add(row["key"])
+
+            if "password_set" not in stored_keys:
+                # Databases from before the flag existed: derive it from the hash
+                row = conn.execute(
+                    "SELECT value FROM settings WHERE key='app_password_hash'"
+                ).fetchone()
+                prefs["password_set"] = "1" if row and row["value"] else "0"
 
     return Preferences(
         invoice_prefix=prefs["invoice_prefix"] or PREF_DEFAULTS["invoice_prefix"],
         invoice_sequence=int(prefs["invoice_sequence"] or PREF_DEFAULTS["invoice_sequence"]),
         default_pdf_dir=prefs["default_pdf_dir"] or PREF_DEFAULTS["default_pdf_dir"],
         auto_open_pdf=(prefs["auto_open_pdf"] == "1"),
+        password_set=(prefs["password_set"] == "1"),
     )
 
 
@@ -187,6 +206,13 @@ def save_preferences(prefs: Preferences) -> None:
             payload,
         )
         conn.commit()
+    get_preferences.cache_clear()
+
+
+def clear_settings_cache() -> None:
+    """Forget cached profile/preferences, e.g. after the DB file was replaced."""
+    get_company_profile.cache_clear()
+    get_preferences.cache_clear()
 
 
 # --------------------------------------------------------------------------- #
@@ -210,13 +236,23 @@ def update_invoice_sequence(next_value: int) -> None:
 # Security helpers
 # --------------------------------------------------------------------------- #
 def set_app_password(password: str) -> None:
-    """Set a password for the application (stored as SHA256 hash). Empty string removes it."""
-    if not password:
-        set_setting("app_password_hash", "")
-        return
+    """
+    Set a password for the application (stored as SHA256 hash). Empty string
+    removes it. The hash and the ``password_set`` flag are written together.
+    """
+    hashed = hashlib.sha256(password.encode("utf-8")).hexdigest() if password else ""
 
-    hashed = hashlib.sha256(password.encode("utf-8")).hexdigest()
-    set_setting("app_password_hash", hashed)
+    with closing(_connect()) as conn:
+        conn.executemany(
+            """
+            INSERT INTO settings (key, value)
+            VALUES (?, ?)
+            ON CONFLICT(key) DO UPDATE SET value=excluded.value
+            """,
+            [("app_password_hash", hashed), ("password_set", "1" if password else "0")],
+        )
+        conn.commit()
+    get_preferences.cache_clear()
 
 
 def verify_app_password(password: str) -> bool:
@@ -230,9 +266,8 @@ def verify_app_password(password: str) -> bool:
 
 
 def is_password_protected() -> bool:
-    """Return True if a password is set."""
-    stored_hash = get_setting("app_password_hash")
-    return bool(stored_hash)
+    """Return True if a password is set (read from the cached preferences flag)."""
+    return get_preferences().password_set
 
 
 if __name__ == "__main__":
@@ -3,8 +3,8 @@ from PySide6.QtWidgets import (
     QComboBox, QLineEdit, QTableWidget, QTableWidgetItem,
     QMessageBox, QHeaderView, QSpinBox, QFrame
 )
-from PySide6.QtCore import Qt, QUrl
-from PySide6.QtGui import QDesktopServices
+from PySide6.QtCore import Qt, QUrl, QTimer, QSignalBlocker
+from PySide6.QtGui import QDesktopServices, QFont, QFontMetrics
 from PySide6.QtWidgets import QFileDialog
 import os
 
@@ -70,13 +70,15 @@ class InvoiceForm(QWidget):
                 border: none;
                 font-weight: bold;
             }
-            QLabel#CustomerDetails {
-                color: #2f2f2f;
-                font-size: 12px;
+            QFrame#CustomerDetails {
                 background-color: #eff2ff;
                 border: 1px dashed #b9c4ff;
                 border-radius: 8px;
-                padding: 6px 10px;
+            }
+            QFrame#CustomerDetails QLabel {
+                color: #2f2f2f;
+                font-size: 12px;
+                background-color: transparent;
             }
             QTableWidget#InvoiceItemsTable {
                 border: 1px solid #e0e0e0;
@@ -144,7 +146,13 @@ class InvoiceForm(QWidget):
 
         self.customer_cb = QComboBox()
         self.load_customers()
-        self.customer_cb.currentIndexChanged.connect(lambda _: self.update_customer_details())
+
+        # Collapse bursts of index changes (typing / completer) into one lookup
+        self._cust_timer = QTimer(self)
+        self._cust_timer.setSingleShot(True)
+        self._cust_timer.setInterval(50)
+        self._cust_timer.timeout.connect(self.update_customer_details)
+        self.customer_cb.currentIndexChanged.connect(lambda _: self._cust_timer.start())
         line_edit_customer = self.customer_cb.lineEdit()
         if line_edit_customer:
             line_edit_customer.setPlaceholderText("Search or select a customer")
@@ -161,9 +169,27 @@ class InvoiceForm(QWidget):
         
         customer_card.layout().addLayout(top_row)
         
-        # Customer detail labels
-        self.customer_details = QLabel("")
+        # Customer detail labels (bold keys via QFont, plain-text values)
+        self.customer_details = QFrame()
         self.customer_details.setObjectName("CustomerDetails")
+        details_row = QHBoxLayout(self.customer_details)
+        details_row.setContentsMargins(10, 6, 10, 6)
+        details_row.setSpacing(4)
+
+        lbl_ntn_key = self._bold_label("NTN:")
+        self.lbl_ntn_val = QLabel("")
+        self.lbl_ntn_val.setTextFormat(Qt.PlainText)
+        lbl_strn_key = self._bold_label("STRN:")
+        self.lbl_strn_val = QLabel("")
+        self.lbl_strn_val.setTextFormat(Qt.PlainText)
+
+        details_row.addWidget(lbl_ntn_key)
+        details_row.addWidget(self.lbl_ntn_val)
+        details_row.addSpacing(24)
+        details_row.addWidget(lbl_strn_key)
+        details_row.addWidget(self.lbl_strn_val)
+        details_row.addStretch()
+
         customer_card.layout().addWidget(self.customer_details)
         layout.addWidget(customer_card)
         self.update_customer_details()
@@ -211,13 +237,20 @@ class InvoiceForm(QWidget):
             "Description", "Qty", "Unit Price",
             "Value", "Sales Tax", "Adv Tax", "Total", "Remove"
         ])
+        self._style_table()
+
         header = self.table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.Stretch)
-        # Other columns auto-size to content but still draggable
-        for i in range(1, 8):
-            header.setSectionResizeMode(i, QHeaderView.Interactive)
-
-        self._style_table()
+        # Other columns use fixed widths so inserts never trigger a
+        # content-size scan over every existing row. The last one is sized
+        # once to fit its "Remove" header, measured in the stylesheet's bold
+        # section font (6px padding each side) since it is not polished yet.
+        header_font = QFont(header.font())
+        header_font.setWeight(QFont.DemiBold)
+        remove_width = QFontMetrics(header_font).horizontalAdvance("Remove") + 2 * 6 + 8
+        for i, width in enumerate((70, 90, 100, 90, 80, 100, remove_width), start=1):
+            header.setSectionResizeMode(i, QHeaderView.Fixed)
+            header.resizeSection(i, width)
         layout.addWidget(self.table)
 
         # ------------------------------
@@ -231,7 +264,8 @@ class InvoiceForm(QWidget):
         totals_layout.setSpacing(6)
 
         def make_total_label(text):
-            lbl = QLabel(f"<b>{text}</b>")
+            # Plain text + bold font: avoids a rich-text parse on every update
+            lbl = self._bold_label(text)
             lbl.setAlignment(Qt.AlignRight)
             lbl.setStyleSheet("font-size: 12px;")
             return lbl
@@ -294,6 +328,14 @@ class InvoiceForm(QWidget):
         lbl.setProperty("class", "section-title")
         return lbl
 
+    def _bold_label(self, text):
+        lbl = QLabel(text)
+        lbl.setTextFormat(Qt.PlainText)
+        font = lbl.font()
+        font.setBold(True)
+        lbl.setFont(font)
+        return lbl
+
     def _style_table(self):
         self.table.setAlternatingRowColors(True)
         self.table.setWordWrap(False)
@@ -324,11 +366,12 @@ class InvoiceForm(QWidget):
 
 
     def load_customers(self):
-        self.customer_cb.clear()
         customers = self.db.get_customers()
 
-        for c in customers:
-            self.customer_cb.addItem(c["name"], c["id"])
+        with QSignalBlocker(self.customer_cb):
+            self.customer_cb.clear()
+            for c in customers:
+                self.customer_cb.addItem(c["name"], c["id"])
 
         self.customer_cb.setEditable(True)
         self.customer_cb.setInsertPolicy(QComboBox.NoInsert)
@@ -346,21 +389,18 @@ class InvoiceForm(QWidget):
     def update_customer_details(self):
         customer_id = self.customer_cb.currentData()
         if not customer_id:
-            self.customer_details.setText("")
+            self.lbl_ntn_val.setText("")
+            self.lbl_strn_val.setText("")
             return
 
         customer = self.db.fetch_one("SELECT * FROM customers WHERE id=?", (customer_id,))
         if not customer:
-            self.customer_details.setText("")
+            self.lbl_ntn_val.setText("")
+            self.lbl_strn_val.setText("")
             return
 
-        ntn = customer.get("ntn") or "N/A"
-        strn = customer.get("strn") or "N/A"
-        text = (
-            f"<b>NTN:</b> {ntn}&nbsp;&nbsp;&nbsp;&nbsp;"
-            f"<b>STRN:</b> {strn}"
-        )
-        self.customer_details.setText(text)
+        self.lbl_ntn_val.setText(customer.get("ntn") or "N/A")
+        self.lbl_strn_val.setText(customer.get("strn") or "N/A")
 
     
     # =====================================================
@@ -472,12 +512,25 @@ class InvoiceForm(QWidget):
             return
 
         # Remove from bottom → top so indices don't shift
-        rows = sorted([idx.row() for idx in selected], reverse=True)
+        rows = sorted(
+            {idx.row() for idx in selected if 0 <= idx.row() < len(self.items)},
+            reverse=True,
+        )
 
+        # Collapse into contiguous (first, count) runs so each block is
+        # removed with a single model call and a single list slice
+        runs = []
         for row in rows:
-            if 0 <= row < len(self.items):
-                self.items.pop(row)
-                self.table.removeRow(row)
+            if runs and runs[-1][0] - 1 == row:
+                first, count = runs[-1]
+                runs[-1] = (row, count + 1)
+            else:
+                runs.append((row, 1))
+
+        model = self.table.model()
+        for first, count in runs:
+            del self.items[first:first + count]
+            model.removeRows(first, count)
 
         # Re-bind row delete buttons (since row indices shifted)
         for r in range(self.table.rowCount()):
@@ -494,20 +547,20 @@ class InvoiceForm(QWidget):
 
     def update_totals(self):
         if not self.items:
-            self.lbl_subtotal.setText("<b>Subtotal: 0</b>")
-            self.lbl_tax.setText("<b>Sales Tax: 0</b>")
-            self.lbl_adv.setText("<b>Advance Tax: 0</b>")
-            self.lbl_grand.setText("<b>Grand Total: 0</b>")
-            self.lbl_qty.setText("<b>Total Quantity (pcs): 0</b>")
+            self.lbl_subtotal.setText("Subtotal: 0")
+            self.lbl_tax.setText("Sales Tax: 0")
+            self.lbl_adv.setText("Advance Tax: 0")
+            self.lbl_grand.setText("Grand Total: 0")
+            self.lbl_qty.setText("Total Quantity (pcs): 0")
             return
 
         summary = summarize_invoice(self.items)
 
-        self.lbl_subtotal.setText(f"<b>Subtotal: {summary['subtotal']}</b>")
-        self.lbl_tax.setText(f"<b>Sales Tax: {summary['sales_tax_total']}</b>")
-        self.lbl_adv.setText(f"<b>Advance Tax: {summary['advance_tax_total']}</b>")
-        self.lbl_grand.setText(f"<b>Grand Total: {summary['grand_total']}</b>")
-        self.lbl_qty.setText(f"<b>Total Quantity (pcs): {summary['total_qty_pieces']}</b>")
+        self.lbl_subtotal.setText(f"Subtotal: {summary['subtotal']}")
+        self.lbl_tax.setText(f"Sales Tax: {summary['sales_tax_total']}")
+        self.lbl_adv.setText(f"Advance Tax: {summary['advance_tax_total']}")
+        self.lbl_grand.setText(f"Grand Total: {summary['grand_total']}")
+        self.lbl_qty.setText(f"Total Quantity (pcs): {summary['total_qty_pieces']}")
 
     # =====================================================
     # Save Invoice
@@ -1,5 +1,21 @@
-from PySide6.QtCore import Qt
+import bisect
+import logging
+from collections import OrderedDict
+
+from PySide6.QtCore import (
+    Qt,
+    QTimer,
+    QObject,
+    QRunnable,
+    QThreadPool,
+    Signal,
+    QAbstractTableModel,
+    QModelIndex,
+    QSignalBlocker,
+)
+from PySide6.QtGui import QBrush
 from PySide6.QtWidgets import (
+    QApplication,
     QWidget,
     QLabel,
     QVBoxLayout,
@@ -7,8 +23,7 @@ from PySide6.QtWidgets import (
     QGridLayout,
     QLineEdit,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QHeaderView,
     QMessageBox,
     QFrame,
@@ -19,6 +34,245 @@ from PySide6.QtWidgets import (
 from src.db import Database
 
 
+# One stylesheet for every ProductsForm, scoped by object name and installed
+# on the QApplication the first time a form is built, so Qt parses the rules
+# once per process instead of once per form instance and card.
+_STYLE = """
+#ProductsForm, #ProductsForm QWidget {
+    font-size: 12px;
+}
+#ProductsForm QLineEdit, #ProductsForm QDoubleSpinBox {
+    padding: 6px;
+}
+#ProductsForm QPushButton[class="primary"] {
+    background-color: #4a63e7;
+    color: white;
+    border: none;
+    padding: 6px 16px;
+    border-radius: 6px;
+    font-weight: 600;
+}
+#ProductsForm QPushButton[class="primary"]:disabled {
+    background-color: #ccc;
+    color: #6f6f6f;
+}
+#ProductsForm QPushButton[class="ghost"] {
+    border: 1px solid #d0d0d0;
+    padding: 6px 14px;
+    border-radius: 6px;
+}
+#ProductsForm QPushButton[class="danger"] {
+    background-color: #ffe8e8;
+    border: 1px solid #ffb3b3;
+    color: #c62828;
+    padding: 6px 12px;
+    border-radius: 6px;
+}
+#ProductsForm QTableView {
+    background-color: white;
+    border: 1px solid #e0e0e0;
+    border-radius: 10px;
+}
+#ProductsForm QCheckBox {
+    spacing: 8px;
+}
+#ProductsForm QFrame#Card {
+    background-color: #ffffff;
+    border: 1px solid #e0e0e0;
+    border-radius: 12px;
+}
+"""
+
+_style_installed = False
+
+
+def _install_style():
+    """Append _STYLE to the application stylesheet (once per process)."""
+    global _style_installed
+    if _style_installed:
+        return
+    app = QApplication.instance()
+    if app is not None:
+        app.setStyleSheet(app.styleSheet() + _STYLE)
+        _style_installed = True
+
+
+# Per-cell role values, built once instead of on every data() call
+_ALIGN_RIGHT = Qt.AlignRight | Qt.AlignVCenter
+_ALIGN_CENTER = Qt.AlignCenter
+_GRAY_BRUSH = QBrush(Qt.GlobalColor.gray)
+
+
+class _FetchSignals(QObject):
+    finished = Signal(list, int)
+
+
+class _FetchWorker(QRunnable):
+    """
+    Fetch products on a pool thread so typing never blocks the UI. The
+    worker queries through its own connection, never the UI thread's.
+    """
+
+    def __init__(self, db_path: str, query: str, request_id: int):
+        super().__init__()
+        self.db_path = db_path
+        self.query = query
+        self.request_id = request_id
+        self.signals = _FetchSignals()
+
+    def run(self):
+        db = None
+        try:
+            db = Database.for_thread(self.db_path)
+            if self.query:
+                products = db.search_products(self.query)
+            else:
+                products = db.get_products()
+        except Exception as exc:
+            logging.error(f"Product fetch failed: {exc}")
+            return
+        finally:
+            if db is not None:
+                db.close()
+        self.signals.finished.emit(products, self.request_id)
+
+
+class ProductsModel(QAbstractTableModel):
+    """
+    Read-only table model over the product dicts returned by ``Database``.
+
+    Rows are exposed to the view a page at a time through
+    ``canFetchMore``/``fetchMore``, and cell text is formatted on demand in
+    ``data()`` with a bounded per-product cache, so work scales with what
+    the user scrolls through rather than with the catalog size.
+    """
+
+    HEADERS = ["Name", "SKU", "Barcode", "Description", "Unit Price", "Tax Rate", "Status"]
+    PAGE_SIZE = 200
+    DISPLAY_CACHE_SIZE = 2000
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._all = []    # full result set
+        self._rows = []   # rows currently exposed to the view
+        self._display_cache = OrderedDict()  # {product_id: display texts}
+
+    def set_products(self, products):
+        self.beginResetModel()
+        self._all = products
+        self._rows = products[:self.PAGE_SIZE]
+        self._display_cache.clear()
+        self.endResetModel()
+
+    def product_at(self, row):
+        return self._rows[row]
+
+    def ensure_loaded(self, row):
+        """Page in rows until ``row`` is visible to the view."""
+        while row >= len(self._rows) and self.canFetchMore(QModelIndex()):
+            self.fetchMore(QModelIndex())
+
+    def refresh_row(self, row):
+        """Re-render one row after its product dict was updated in place."""
+        self._display_cache.pop(self._all[row]["id"], None)
+        if row < len(self._rows):
+            self.dataChanged.emit(
+                self.index(row, 0), self.index(row, len(self.HEADERS) - 1)
+            )
+
+    def insert_product(self, row, product):
+        if row <= len(self._rows):
+            self.beginInsertRows(QModelIndex(), row, row)
+            self._all.insert(row, product)
+            self._rows.insert(row, product)
+            self.endInsertRows()
+        else:
+            self._all.insert(row, product)
+
+    def remove_product(self, row):
+        product = self._all[row]
+        self._display_cache.pop(product["id"], None)
+        if row < len(self._rows):
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self._all[row]
+            del self._rows[row]
+            self.endRemoveRows()
+        else:
+            del self._all[row]
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and len(self._rows) < len(self._all)
+
+    def fetchMore(self, parent=QModelIndex()):
+        start = len(self._rows)
+        end = min(start + self.PAGE_SIZE, len(self._all))
+        if start >= end:
+            return
+        self.beginInsertRows(QModelIndex(), start, end - 1)
+        self._rows.extend(self._all[start:end])
+        self.endInsertRows()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def _display(self, product):
+        cache = self._display_cache
+        product_id = product["id"]
+        values = cache.get(product_id)
+        if values is not None:
+            cache.move_to_end(product_id)
+            return values
+
+        values = (
+            product["name"],
+            product.get("sku") or "—",
+            product.get("barcode") or "—",
+            product.get("description") or "—",
+            f"Rs {product['unit_price']:.2f}",
+            f"{product['tax_rate']:.2f}%",
+            "Active" if product.get("active", 1) else "Inactive",
+        )
+        cache[product_id] = values
+        if len(cache) > self.DISPLAY_CACHE_SIZE:
+            cache.popitem(last=False)
+        return values
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        product = self._rows[index.row()]
+        col = index.column()
+
+        if role == Qt.DisplayRole:
+            return self._display(product)[col]
+
+        if role == Qt.TextAlignmentRole:
+            if col in (4, 5):
+                return _ALIGN_RIGHT
+            if col == 6:
+                return _ALIGN_CENTER
+            return None
+
+        if role == Qt.ForegroundRole:
+            if col == 6 and not product.get("active", 1):
+                return _GRAY_BRUSH
+            return None
+
+        if role == Qt.UserRole:
+            return product["id"]
+
+        return None
+
+
 class ProductsForm(QWidget):
     """
     Product master data manager.
@@ -29,13 +283,34 @@ class ProductsForm(QWidget):
         • Manage product details (name, description, price, tax rate)
     """
 
+    # Above this many products, searches go to the FTS index instead
+    CLIENT_FILTER_LIMIT = 5000
+
     def __init__(self):
         super().__init__()
+        self.setObjectName("ProductsForm")
+        _install_style()
 
-        self.db = Database()
+        self.db = Database.instance()
         self.editing_product_id = None
         self.current_products = []
 
+        # Query behind the rows on screen; reloads are skipped until it
+        # changes or data is saved
+        self._last_query = None
+        self._cache_dirty = True
+        # Unfiltered active catalog, filtered in-process while it is fresh
+        self._all_products = None
+
+        # {product_id: row index} for O(1) selection lookups
+        self._id_to_row = {}
+        self._products_by_id = {}
+        self._restoring_selection = False
+
+        # Monotonic id of the newest fetch; older results are dropped
+        self._latest_request_id = 0
+        self._pending_query = None
+
         self._build_ui()
         self.load_products()
 
@@ -47,49 +322,6 @@ class ProductsForm(QWidget):
         root.setContentsMargins(24, 24, 24, 24)
         root.setSpacing(16)
 
-        self.setStyleSheet(
-            """
-            QWidget {
-                font-size: 12px;
-            }
-            QLineEdit, QDoubleSpinBox {
-                padding: 6px;
-            }
-            QPushButton[class="primary"] {
-                background-color: #4a63e7;
-                color: white;
-                border: none;
-                padding: 6px 16px;
-                border-radius: 6px;
-                font-weight: 600;
-            }
-            QPushButton[class="primary"]:disabled {
-                background-color: #ccc;
-                color: #6f6f6f;
-            }
-            QPushButton[class="ghost"] {
-                border: 1px solid #d0d0d0;
-                padding: 6px 14px;
-                border-radius: 6px;
-            }
-            QPushButton[class="danger"] {
-                background-color: #ffe8e8;
-                border: 1px solid #ffb3b3;
-                color: #c62828;
-                padding: 6px 12px;
-                border-radius: 6px;
-            }
-            QTableWidget {
-                background-color: white;
-                border: 1px solid #e0e0e0;
-                border-radius: 10px;
-            }
-            QCheckBox {
-                spacing: 8px;
-            }
-            """
-        )
-
         # Header
         header_row = QHBoxLayout()
         title = QLabel("Products")
@@ -108,7 +340,12 @@ class ProductsForm(QWidget):
         search_label = QLabel("Search:")
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Search by name, SKU, barcode or description…")
-        self.search_input.textChanged.connect(self.load_products)
+        # Debounce typing so a burst of keystrokes triggers a single reload
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(200)
+        self._search_timer.timeout.connect(self.load_products)
+        self.search_input.textChanged.connect(self._search_timer.start)
 
         clear_search_btn = QPushButton("Clear")
         clear_search_btn.setProperty("class", "ghost")
@@ -201,23 +438,24 @@ class ProductsForm(QWidget):
         list_header.setStyleSheet("font-weight: 600;")
         list_card.layout().addWidget(list_header)
 
-        self.products_table = QTableWidget(0, 7)
-        self.products_table.setHorizontalHeaderLabels(
-            ["Name", "SKU", "Barcode", "Description", "Unit Price", "Tax Rate", "Status"]
+        self.products_model = ProductsModel(self)
+        self.products_view = QTableView()
+        self.products_view.setModel(self.products_model)
+        self.products_view.setSelectionBehavior(QTableView.SelectRows)
+        self.products_view.setSelectionMode(QTableView.SingleSelection)
+        self.products_view.setEditTriggers(QTableView.NoEditTriggers)
+        self.products_view.verticalHeader().setVisible(False)
+        self.products_view.selectionModel().selectionChanged.connect(
+            self._handle_selection_change
         )
-        self.products_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.products_table.setSelectionMode(QTableWidget.SingleSelection)
-        self.products_table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.products_table.verticalHeader().setVisible(False)
-        self.products_table.itemSelectionChanged.connect(self._handle_selection_change)
 
-        header = self.products_table.horizontalHeader()
+        header = self.products_view.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.Stretch)
         header.setSectionResizeMode(3, QHeaderView.Stretch)
         for idx in (1, 2, 4, 5, 6):
             header.setSectionResizeMode(idx, QHeaderView.ResizeToContents)
 
-        list_card.layout().addWidget(self.products_table)
+        list_card.layout().addWidget(self.products_view)
         list_hint = QLabel("Tip: Select a row to edit the product.")
         list_hint.setStyleSheet("color: #7f7f7f; font-style: italic;")
         list_card.layout().addWidget(list_hint)
@@ -226,15 +464,6 @@ class ProductsForm(QWidget):
     def _make_card(self):
         card = QFrame()
         card.setObjectName("Card")
-        card.setStyleSheet(
-            """
-            QFrame#Card {
-                background-color: #ffffff;
-                border: 1px solid #e0e0e0;
-                border-radius: 12px;
-            }
-            """
-        )
         layout = QVBoxLayout(card)
         layout.setContentsMargins(18, 16, 18, 16)
         layout.setSpacing(12)
@@ -245,51 +474,118 @@ class ProductsForm(QWidget):
     # ------------------------------------------------------------------ #
     def load_products(self):
         query = self.search_input.text().strip()
-        if query:
-            products = self.db.search_products(query)
-        else:
-            products = self.db.get_products()
+        # Bump first so a fetch still in flight for an older query is ignored,
+        # even when we return early because the shown results already match.
+        self._latest_request_id += 1
+        if query == self._last_query and not self._cache_dirty:
+            return
+
+        self._pending_query = query
+
+        catalog = self._all_products
+        if catalog is not None and len(catalog) < self.CLIENT_FILTER_LIMIT:
+            # Small catalog already in memory: a substring scan beats a DB trip
+            self._apply_products(self._filter_products(catalog, query), self._latest_request_id)
+            return
+
+        worker = _FetchWorker(self.db.db_path, query, self._latest_request_id)
+        worker.signals.finished.connect(self._apply_products)
+        QThreadPool.globalInstance().start(worker)
+
+    def _apply_products(self, products, request_id):
+        if request_id != self._latest_request_id:
+            return  # a newer search superseded this one
+
+        self._last_query = self._pending_query
+        self._cache_dirty = False
+        if not self._last_query:
+            self._all_products = products
 
         self.current_products = products
-        self.products_table.setRowCount(len(products))
-
-        for row, product in enumerate(products):
-            name_item = QTableWidgetItem(product["name"])
-            name_item.setData(Qt.UserRole, product["id"])
-            self.products_table.setItem(row, 0, name_item)
-
-            sku_item = QTableWidgetItem(product.get("sku") or "—")
-            self.products_table.setItem(row, 1, sku_item)
-
-            barcode_item = QTableWidgetItem(product.get("barcode") or "—")
-            self.products_table.setItem(row, 2, barcode_item)
-
-            self.products_table.setItem(row, 3, QTableWidgetItem(product.get("description") or "—"))
-            
-            price_item = QTableWidgetItem(f"Rs {product['unit_price']:.2f}")
-            price_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            self.products_table.setItem(row, 4, price_item)
-            
-            tax_item = QTableWidgetItem(f"{product['tax_rate']:.2f}%")
-            tax_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            self.products_table.setItem(row, 5, tax_item)
-            
-            status = "Active" if product.get("active", 1) else "Inactive"
-            status_item = QTableWidgetItem(status)
-            status_item.setTextAlignment(Qt.AlignCenter)
-            if not product.get("active", 1):
-                status_item.setForeground(Qt.GlobalColor.gray)
-            self.products_table.setItem(row, 6, status_item)
-
-        if products:
-            self.summary_label.setText(f"{len(products)} products")
+        self._index_products()
+
+        # One model reset instead of per-cell item construction
+        self.products_model.set_products(products)
+        self._update_summary()
+
+        # Keep selection if editing id still exists (signals are live again)
+        if self.editing_product_id:
+            self._select_row_by_id(self.editing_product_id)
+
+    @staticmethod
+    def _filter_products(products, query):
+        """Case-insensitive substring match, mirroring Database.search_products."""
+        if not query:
+            return products
+        q = query.lower()
+        return [
+            p for p in products
+            if q in (p["name"] or "").lower()
+            or q in (p.get("sku") or "").lower()
+            or q in (p.get("barcode") or "").lower()
+            or q in (p.get("description") or "").lower()
+        ]
+
+    def _invalidate_cache(self):
+        """Force the next load_products() back to the database."""
+        self._cache_dirty = True
+        self._all_products = None
+
+    def _index_products(self):
+        products = self.current_products
+        self._id_to_row = {p["id"]: row for row, p in enumerate(products)}
+        self._products_by_id = {p["id"]: p for p in products}
+
+    def _update_summary(self):
+        if self.current_products:
+            self.summary_label.setText(f"{len(self.current_products)} products")
         else:
             self.summary_label.setText("No products yet. Add your first one.")
 
-        # Keep selection if editing id still exists
+    def _apply_saved_product(self, product_id, data):
+        """
+        Reflect a just-saved product in the list without re-querying.
+        Falls back to a reload while a search filter is active, since the
+        saved product may no longer (or newly) match it.
+        """
+        if self.search_input.text().strip() or self._last_query != "":
+            self._invalidate_cache()
+            self.load_products()
+            return
+
+        model = self.products_model
+        row = self._id_to_row.get(product_id)
+        product = self._products_by_id.get(product_id)
+        renamed = product is None or product["name"] != data["name"]
+
+        if product is None:
+            product = {"id": product_id}
+        product.update(data)
+
+        if not product.get("active", 1):
+            # Only active products are listed
+            if row is not None:
+                model.remove_product(row)
+        elif row is not None and not renamed:
+            self._refresh_row(product_id)
+            return
+        else:
+            if row is not None:
+                model.remove_product(row)
+            # Keep the list in the same name order the query returns
+            names = [p["name"] for p in self.current_products]
+            model.insert_product(bisect.bisect_right(names, product["name"]), product)
+
+        self._index_products()
+        self._update_summary()
         if self.editing_product_id:
             self._select_row_by_id(self.editing_product_id)
 
+    def _refresh_row(self, product_id):
+        row = self._id_to_row.get(product_id)
+        if row is not None:
+            self.products_model.refresh_row(row)
+
     # ------------------------------------------------------------------ #
     # CRUD actions
     # ------------------------------------------------------------------ #
@@ -320,13 +616,11 @@ class ProductsForm(QWidget):
             if self.editing_product_id:
                 self.db.update_product(self.editing_product_id, data)
                 QMessageBox.information(self, "Product updated", "Changes saved successfully.")
+                self._apply_saved_product(self.editing_product_id, data)
             else:
-                self.db.add_product(data)
+                product_id = self.db.add_product(data)
                 QMessageBox.information(self, "Product added", "Product saved successfully.")
-
-            self.load_products()
-            if self.editing_product_id:
-                self._select_row_by_id(self.editing_product_id)
+                self._apply_saved_product(product_id, data)
 
         except Exception as exc:
             QMessageBox.critical(self, "Error", f"Failed to save product.\n{exc}")
@@ -347,6 +641,7 @@ class ProductsForm(QWidget):
         try:
             self.db.delete_product(self.editing_product_id)
             QMessageBox.information(self, "Deleted", "Product deactivated successfully.")
+            self._invalidate_cache()
             self.reset_form()
             self.load_products()
         except Exception as exc:
@@ -356,7 +651,10 @@ class ProductsForm(QWidget):
     # Helpers
     # ------------------------------------------------------------------ #
     def _handle_selection_change(self):
-        selected = self.products_table.selectedItems()
+        if self._restoring_selection:
+            return
+
+        selected = self.products_view.selectionModel().selectedRows()
         if not selected:
             self.editing_product_id = None
             self.delete_btn.setEnabled(False)
@@ -364,9 +662,8 @@ class ProductsForm(QWidget):
             self._clear_form_fields(keep_search=True)
             return
 
-        row = selected[0].row()
-        product_id = self.products_table.item(row, 0).data(Qt.UserRole)
-        product = next((p for p in self.current_products if p["id"] == product_id), None)
+        product_id = selected[0].data(Qt.UserRole)
+        product = self._products_by_id.get(product_id)
         if not product:
             return
 
@@ -386,12 +683,13 @@ class ProductsForm(QWidget):
 
     def reset_form(self, clear_search: bool = False):
         self.editing_product_id = None
-        self.products_table.clearSelection()
+        self.products_view.clearSelection()
         self._clear_form_fields(keep_search=not clear_search)
-        if clear_search:
-            self.search_input.clear()
         self.delete_btn.setEnabled(False)
         self.save_btn.setText("Add Product")
+        if clear_search:
+            # The search text was cleared silently; reload once, right away
+            self.load_products()
 
     def _clear_form_fields(self, keep_search: bool = True):
         self.name_input.clear()
@@ -402,13 +700,21 @@ class ProductsForm(QWidget):
         self.tax_rate_input.setValue(18.0)
         self.active_checkbox.setChecked(True)
         if not keep_search:
+            self._clear_search_silently()
+
+    def _clear_search_silently(self):
+        """Clear the search box without emitting textChanged (and its reload)."""
+        self._search_timer.stop()
+        with QSignalBlocker(self.search_input):
             self.search_input.clear()
 
     def _select_row_by_id(self, product_id: int):
-        for row in range(self.products_table.rowCount()):
-            item = self.products_table.item(row, 0)
-            if item and item.data(Qt.UserRole) == product_id:
-                self.products_table.blockSignals(True)
-                self.products_table.selectRow(row)
-                self.products_table.blockSignals(False)
-                break
+        row = self._id_to_row.get(product_id)
+        if row is not None:
+            self.products_model.ensure_loaded(row)
+            # Don't block the selection model itself: the view listens to it
+            self._restoring_selection = True
+            try:
+                self.products_view.selectRow(row)
+            finally:
+                self._restoring_selection = False
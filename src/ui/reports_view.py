@@ -3,8 +3,22 @@ from calendar import month_name
 import os
 import subprocess
 import sys
-
-from PySide6.QtCore import Qt, QDate
+from collections import OrderedDict
+from functools import partial
+
+from PySide6.QtCore import (
+    Qt,
+    QDate,
+    QEvent,
+    QTimer,
+    QObject,
+    QRunnable,
+    QThreadPool,
+    Signal,
+    QAbstractTableModel,
+    QModelIndex,
+)
+from PySide6.QtGui import QColor, QPainter
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -14,7 +28,10 @@ from PySide6.QtWidgets import (
     QPushButton,
     QTableWidget,
     QTableWidgetItem,
+    QTableView,
+    QStyledItemDelegate,
     QMessageBox,
+    QProgressDialog,
     QFileDialog,
     QComboBox,
     QSpinBox,
@@ -31,12 +48,16 @@ from src.reports import generate_monthly_report
 from src.reports_analytics import (
     export_summary_to_csv,
     export_summary_to_excel,
-    fetch_summary,
-    fetch_top_products,
-    fetch_top_customers,
+    fetch_summary_bundle,
 )
 
 
+# Bound str.format methods, looked up once instead of per formatted cell
+_CURRENCY_FMT = "{:,.2f}".format
+_QTY_FMT = "{:,.0f}".format
+_COUNT_FMT = "{:.0f}".format
+
+
 def open_pdf(path: str):
     """Cross-platform open-PDF helper."""
     if not path or not os.path.isfile(path):
@@ -44,10 +65,224 @@ def open_pdf(path: str):
 
     if sys.platform.startswith("win"):
         os.startfile(path)
-    elif sys.platform == "darwin":
-        subprocess.call(["open", path])
-    else:
-        subprocess.call(["xdg-open", path])
+        return
+
+    opener = "open" if sys.platform == "darwin" else "xdg-open"
+    # Fire and forget: don't wait for the viewer to launch
+    subprocess.Popen(
+        [opener, path],
+        start_new_session=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+class _MonthlyReportSignals(QObject):
+    done = Signal(str)
+    empty = Signal(str)
+    failed = Signal(str)
+
+
+class MonthlyReportJob(QRunnable):
+    """Build the monthly PDF on a pool thread so the window stays responsive."""
+
+    def __init__(self, year: int, month: int, output_dir, include_summary: bool):
+        super().__init__()
+        self.year = year
+        self.month = month
+        self.output_dir = output_dir
+        self.include_summary = include_summary
+        self.signals = _MonthlyReportSignals()
+
+    def run(self):
+        try:
+            pdf_path = generate_monthly_report(
+                self.year,
+                self.month,
+                output_dir=self.output_dir,
+                include_summary=self.include_summary,
+            )
+        except ValueError as exc:
+            self.signals.empty.emit(str(exc))
+            return
+        except Exception as exc:
+            self.signals.failed.emit(str(exc))
+            return
+        self.signals.done.emit(pdf_path)
+
+
+class _JobSignals(QObject):
+    done = Signal(object)
+    failed = Signal(str)
+
+
+class _BackgroundJob(QRunnable):
+    """Run an arbitrary callable on a pool thread and report the outcome."""
+
+    def __init__(self, fn):
+        super().__init__()
+        self.fn = fn
+        self.signals = _JobSignals()
+
+    def run(self):
+        try:
+            result = self.fn()
+        except Exception as exc:
+            self.signals.failed.emit(str(exc))
+            return
+        self.signals.done.emit(result)
+
+
+class InvoiceTableModel(QAbstractTableModel):
+    """
+    Read-only table model over the invoices returned by ``Database``.
+
+    Only the first page of the current search is queried up front; further
+    pages are pulled through ``canFetchMore``/``fetchMore`` as the view
+    scrolls towards the bottom.
+    """
+
+    HEADERS = ["Invoice No", "Customer", "Date", "Total Amount", "PDF Path", "Actions"]
+    ACTION_COLUMN = 5
+    PAGE_SIZE = 100
+
+    def __init__(self, db: Database, parent=None):
+        super().__init__(parent)
+        self.db = db
+        self._query = ""
+        self._rows = []
+        self._total_count = 0
+
+    def load(self, query: str = ""):
+        self.beginResetModel()
+        self._query = query
+        self._total_count = self.db.count_invoices(query)
+        self._rows = list(self._fetch_page(0))
+        self.endResetModel()
+
+    def _fetch_page(self, offset: int):
+        if self._query:
+            return self.db.search_invoices(self._query, limit=self.PAGE_SIZE, offset=offset)
+        return self.db.get_invoices(limit=self.PAGE_SIZE, offset=offset)
+
+    def invoice_at(self, row):
+        return self._rows[row]
+
+    def row_id_at(self, row):
+        return self._rows[row]["id"]
+
+    def remove_invoice(self, invoice_id: int) -> bool:
+        """Drop one loaded invoice without re-querying the rest."""
+        for row, inv in enumerate(self._rows):
+            if inv["id"] == invoice_id:
+                break
+        else:
+            return False
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        self._total_count -= 1
+        self.endRemoveRows()
+        return True
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and len(self._rows) < self._total_count
+
+    def fetchMore(self, parent=QModelIndex()):
+        page = self._fetch_page(len(self._rows))
+        if not page:
+            # Rows were removed since the count was taken
+            self._total_count = len(self._rows)
+            return
+        start = len(self._rows)
+        self.beginInsertRows(QModelIndex(), start, start + len(page) - 1)
+        self._rows.extend(page)
+        self.endInsertRows()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+
+        inv = self._rows[index.row()]
+        col = index.column()
+        if col == 0:
+            return inv["invoice_no"]
+        if col == 1:
+            return inv.get("customer_name", "")
+        if col == 2:
+            return inv["date"]
+        if col == 3:
+            return str(inv["total_amount"])
+        if col == 4:
+            return inv.get("pdf_path", "")
+        return "Delete"
+
+
+class ActionDelegate(QStyledItemDelegate):
+    """
+    Paints a red "Delete" pill in the actions column and turns clicks on it
+    into ``delete_requested(invoice_id)``, so no widget or closure is
+    created per row.
+    """
+
+    delete_requested = Signal(int)
+
+    _PILL_COLOR = QColor("#c0392b")
+    _TEXT_COLOR = QColor("white")
+
+    def paint(self, painter, option, index):
+        rect = option.rect.adjusted(6, 4, -6, -4)
+        radius = rect.height() / 2
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(self._PILL_COLOR)
+        painter.drawRoundedRect(rect, radius, radius)
+        painter.setPen(self._TEXT_COLOR)
+        painter.drawText(rect, Qt.AlignCenter, "Delete")
+        painter.restore()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._swallow_release = False
+
+    def editorEvent(self, event, model, option, index):
+        etype = event.type()
+        if etype == QEvent.MouseButtonPress:
+            self._swallow_release = False  # a fresh click
+        elif etype == QEvent.MouseButtonDblClick and event.button() == Qt.LeftButton:
+            # A double-click ends with a second release; the first one already
+            # asked for the delete, so don't queue another confirmation.
+            self._swallow_release = True
+            return True
+        elif etype == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            if self._swallow_release:
+                self._swallow_release = False
+                return True
+            if option.rect.contains(event.position().toPoint()):
+                self.delete_requested.emit(model.row_id_at(index.row()))
+                return True
+        return super().editorEvent(event, model, option, index)
+
+
+class InvoiceTableView(QTableView):
+    """
+    QTableView whose column size hints are the current widths, so Qt never
+    formats every cell of a column just to guess how wide it should be.
+    """
+
+    def sizeHintForColumn(self, column):
+        return self.columnWidth(column)
 
 
 class ReportsView(QWidget):
@@ -59,6 +294,8 @@ class ReportsView(QWidget):
         • Double click → open PDF
     """
 
+    SUMMARY_CACHE_SIZE = 32
+
     def __init__(self):
         super().__init__()
 
@@ -69,6 +306,12 @@ class ReportsView(QWidget):
         os.makedirs(self.default_output_dir, exist_ok=True)
         self.summary_data = None
         self.summary_rows = []
+        # {(start_date, end_date): (summary, rows, top_products, top_customers)}
+        self._summary_cache = OrderedDict()
+        self._monthly_job = None
+        self._monthly_progress = None
+        self._background_job = None
+        self._background_progress = None
 
         # ---------- Layout root ----------
         layout = QVBoxLayout()
@@ -95,21 +338,33 @@ class ReportsView(QWidget):
 
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Search by invoice number or customer name...")
-        self.search_input.textChanged.connect(self.load_invoices)
+
+        # Debounce typing so only the last keystroke hits the database
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(200)
+        self._search_timer.timeout.connect(self.load_invoices)
+        self.search_input.textChanged.connect(self._search_timer.start)
 
         refresh_btn = QPushButton("Refresh")
-        refresh_btn.clicked.connect(self.load_invoices)
+        refresh_btn.clicked.connect(self.refresh_invoices)
 
         search_row.addWidget(self.search_input)
         search_row.addWidget(refresh_btn)
         layout.addLayout(search_row)
 
         # ---------- Invoice table ----------
-        self.table = QTableWidget()
-        self.table.setColumnCount(6)
-        self.table.setHorizontalHeaderLabels([
-            "Invoice No", "Customer", "Date", "Total Amount", "PDF Path", "Actions"
-        ])
+        self.model = InvoiceTableModel(self.db, self)
+        self.table = InvoiceTableView()
+        self.table.setModel(self.model)
+        action_delegate = ActionDelegate(self.table)
+        # Queued so the confirmation dialog and model reset run after the
+        # view has finished handling the click
+        action_delegate.delete_requested.connect(self.delete_invoice, Qt.QueuedConnection)
+        self.table.setItemDelegateForColumn(InvoiceTableModel.ACTION_COLUMN, action_delegate)
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        header.setDefaultSectionSize(150)
         self.table.setColumnWidth(0, 120)  # Invoice
         self.table.setColumnWidth(1, 200)  # Customer
         self.table.setColumnWidth(2, 120)  # Date
@@ -117,11 +372,11 @@ class ReportsView(QWidget):
         self.table.setColumnWidth(4, 300)  # PDF Path
         self.table.setColumnWidth(5, 120)  # Actions
 
-        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.table.setEditTriggers(QTableView.NoEditTriggers)
+        self.table.setSelectionBehavior(QTableView.SelectRows)
 
         # Double-click event: open PDF
-        self.table.itemDoubleClicked.connect(self.on_row_double_clicked)
+        self.table.doubleClicked.connect(self.on_row_double_clicked)
 
         layout.addWidget(self.table)
 
@@ -193,9 +448,9 @@ class ReportsView(QWidget):
 
         action_row = QHBoxLayout()
         action_row.addStretch()
-        generate_btn = QPushButton("Generate Monthly PDF")
-        generate_btn.clicked.connect(self.handle_generate_monthly_pdf)
-        action_row.addWidget(generate_btn)
+        self.generate_btn = QPushButton("Generate Monthly PDF")
+        self.generate_btn.clicked.connect(self.handle_generate_monthly_pdf)
+        action_row.addWidget(self.generate_btn)
         wrapper.addLayout(action_row)
 
         return frame
@@ -314,21 +569,44 @@ class ReportsView(QWidget):
         include_summary = self.summary_checkbox.isChecked()
         output_dir = self.output_dir_input.text().strip() or None
 
-        try:
-            pdf_path = generate_monthly_report(
-                year, month, output_dir=output_dir, include_summary=include_summary
-            )
-        except ValueError as exc:
-            QMessageBox.information(self, "No Invoices", str(exc))
-            return
-        except Exception as exc:
-            QMessageBox.critical(
-                self,
-                "Generation Failed",
-                f"Could not generate monthly PDF:\n{exc}",
-            )
-            return
+        self._summary_cache.clear()
+        self.generate_btn.setEnabled(False)
+
+        progress = QProgressDialog("Generating monthly PDF…", None, 0, 0, self)
+        progress.setWindowTitle("Please wait")
+        progress.setWindowModality(Qt.WindowModal)
+        progress.setMinimumDuration(0)
+        progress.show()
+        self._monthly_progress = progress
+
+        job = MonthlyReportJob(year, month, output_dir, include_summary)
+        job.signals.done.connect(self._on_monthly_pdf_ready)
+        job.signals.empty.connect(self._on_monthly_pdf_empty)
+        job.signals.failed.connect(self._on_monthly_pdf_failed)
+        self._monthly_job = job
+        QThreadPool.globalInstance().start(job)
+
+    def _finish_monthly_job(self):
+        self._monthly_job = None
+        if self._monthly_progress is not None:
+            self._monthly_progress.close()
+            self._monthly_progress = None
+        self.generate_btn.setEnabled(True)
+
+    def _on_monthly_pdf_empty(self, message: str):
+        self._finish_monthly_job()
+        QMessageBox.information(self, "No Invoices", message)
+
+    def _on_monthly_pdf_failed(self, message: str):
+        self._finish_monthly_job()
+        QMessageBox.critical(
+            self,
+            "Generation Failed",
+            f"Could not generate monthly PDF:\n{message}",
+        )
 
+    def _on_monthly_pdf_ready(self, pdf_path: str):
+        self._finish_monthly_job()
         msg = QMessageBox(self)
         msg.setWindowTitle("Monthly PDF Ready")
         msg.setIcon(QMessageBox.Information)
@@ -350,17 +628,26 @@ class ReportsView(QWidget):
             QMessageBox.warning(self, "Invalid Range", "Start date must be before end date.")
             return
 
-        try:
-            summary, rows = fetch_summary(start_date, end_date)
-            top_products = fetch_top_products(start_date, end_date)
-            top_customers = fetch_top_customers(start_date, end_date)
-        except Exception as exc:
-            QMessageBox.critical(
-                self,
-                "Summary Failed",
-                f"Unable to compute summary:\n{exc}",
-            )
-            return
+        key = (start_date, end_date)
+        cached = self._summary_cache.get(key)
+        if cached is not None:
+            self._summary_cache.move_to_end(key)
+            summary, rows, top_products, top_customers = cached
+        else:
+            try:
+                summary, rows, top_products, top_customers = fetch_summary_bundle(
+                    start_date, end_date
+                )
+            except Exception as exc:
+                QMessageBox.critical(
+                    self,
+                    "Summary Failed",
+                    f"Unable to compute summary:\n{exc}",
+                )
+                return
+            self._summary_cache[key] = (summary, rows, top_products, top_customers)
+            if len(self._summary_cache) > self.SUMMARY_CACHE_SIZE:
+                self._summary_cache.popitem(last=False)
 
         self.summary_data = summary
         self.summary_rows = rows
@@ -380,37 +667,59 @@ class ReportsView(QWidget):
                 label.setText("—")
             return
 
-        def fmt_currency(value):
-            return f"{value:,.2f}"
-
-        def fmt_qty(value):
-            return f"{value:,.0f}"
-
         mapping = {
-            "total_sales": fmt_currency(summary.get("total_sales", 0)),
-            "total_sales_tax": fmt_currency(summary.get("total_sales_tax", 0)),
-            "total_advance_tax": fmt_currency(summary.get("total_advance_tax", 0)),
-            "total_quantity": fmt_qty(summary.get("total_quantity", 0)),
+            "total_sales": _CURRENCY_FMT(summary.get("total_sales", 0)),
+            "total_sales_tax": _CURRENCY_FMT(summary.get("total_sales_tax", 0)),
+            "total_advance_tax": _CURRENCY_FMT(summary.get("total_advance_tax", 0)),
+            "total_quantity": _QTY_FMT(summary.get("total_quantity", 0)),
             "invoice_count": str(summary.get("invoice_count", 0)),
         }
 
         for key, label in self.summary_labels.items():
-            label.setText(mapping.get(key, "—"))
+            text = mapping.get(key, "—")
+            if label.text() != text:
+                label.setText(text)
 
     def _update_insights_tables(self, products, customers):
-        # Products
-        self.top_products_table.setRowCount(len(products))
-        for row, p in enumerate(products):
-            self.top_products_table.setItem(row, 0, QTableWidgetItem(p["product_name"]))
-            self.top_products_table.setItem(row, 1, QTableWidgetItem(f"{p['total_qty']:.0f}"))
-            self.top_products_table.setItem(row, 2, QTableWidgetItem(f"{p['total_revenue']:,.2f}"))
-            
-        # Customers
-        self.top_customers_table.setRowCount(len(customers))
-        for row, c in enumerate(customers):
-            self.top_customers_table.setItem(row, 0, QTableWidgetItem(c["customer_name"]))
-            self.top_customers_table.setItem(row, 1, QTableWidgetItem(str(c["invoice_count"])))
-            self.top_customers_table.setItem(row, 2, QTableWidgetItem(f"{c['total_spent']:,.2f}"))
+        self._fill_table(
+            self.top_products_table,
+            [
+                (p["product_name"], _COUNT_FMT(p["total_qty"]), _CURRENCY_FMT(p["total_revenue"]))
+                for p in products
+            ],
+        )
+        self._fill_table(
+            self.top_customers_table,
+            [
+                (c["customer_name"], str(c["invoice_count"]), _CURRENCY_FMT(c["total_spent"]))
+                for c in customers
+            ],
+        )
+
+    @staticmethod
+    def _fill_table(table, rows):
+        """
+        Populate a QTableWidget with repaints, sorting and signals paused.
+        Items already in the table are reused via setText; new ones are only
+        created for rows the table did not have before.
+        """
+        sorting = table.isSortingEnabled()
+        table.setUpdatesEnabled(False)
+        table.setSortingEnabled(False)
+        table.blockSignals(True)
+        try:
+            table.setRowCount(len(rows))
+            for row, values in enumerate(rows):
+                for col, text in enumerate(values):
+                    item = table.item(row, col)
+                    if item is None:
+                        table.setItem(row, col, QTableWidgetItem(text))
+                    elif item.text() != text:
+                        item.setText(text)
+        finally:
+            table.blockSignals(False)
+            table.setSortingEnabled(sorting)
+            table.setUpdatesEnabled(True)
 
     def handle_export_csv(self):
         if not self.summary_data:
@@ -426,13 +735,12 @@ class ReportsView(QWidget):
         if not path:
             return
 
-        try:
-            export_summary_to_csv(self.summary_data, self.summary_rows, path)
-        except Exception as exc:
-            QMessageBox.critical(self, "Export Failed", f"Could not export CSV:\n{exc}")
-            return
-
-        QMessageBox.information(self, "Export Complete", f"CSV saved to:\n{path}")
+        self._run_in_background(
+            partial(export_summary_to_csv, self.summary_data, self.summary_rows, path),
+            on_done=partial(self._on_export_done, "CSV"),
+            on_error=partial(self._on_export_failed, "CSV"),
+            busy_label="Writing CSV…",
+        )
 
     def handle_export_excel(self):
         if not self.summary_data:
@@ -448,47 +756,69 @@ class ReportsView(QWidget):
         if not path:
             return
 
-        try:
-            export_summary_to_excel(self.summary_data, self.summary_rows, path)
-        except Exception as exc:
-            QMessageBox.critical(self, "Export Failed", f"Could not export Excel:\n{exc}")
-            return
+        self._run_in_background(
+            partial(export_summary_to_excel, self.summary_data, self.summary_rows, path),
+            on_done=partial(self._on_export_done, "Excel"),
+            on_error=partial(self._on_export_failed, "Excel"),
+            busy_label="Writing Excel…",
+        )
 
-        QMessageBox.information(self, "Export Complete", f"Excel saved to:\n{path}")
+    def _on_export_done(self, kind: str, path: str):
+        QMessageBox.information(self, "Export Complete", f"{kind} saved to:\n{path}")
+
+    def _on_export_failed(self, kind: str, message: str):
+        QMessageBox.critical(self, "Export Failed", f"Could not export {kind}:\n{message}")
+
+    def _run_in_background(self, fn, on_done, on_error, busy_label: str):
+        """
+        Run ``fn`` on the global thread pool behind a busy dialog, with the
+        export buttons disabled, then hand its result to ``on_done`` or the
+        error message to ``on_error`` on the UI thread.
+        """
+        self.summary_csv_btn.setEnabled(False)
+        self.summary_excel_btn.setEnabled(False)
+
+        progress = QProgressDialog(busy_label, None, 0, 0, self)
+        progress.setWindowTitle("Please wait")
+        progress.setWindowModality(Qt.WindowModal)
+        progress.setMinimumDuration(0)
+        progress.show()
+        self._background_progress = progress
+
+        job = _BackgroundJob(fn)
+        job.signals.done.connect(partial(self._finish_background_job, on_done))
+        job.signals.failed.connect(partial(self._finish_background_job, on_error))
+        self._background_job = job
+        QThreadPool.globalInstance().start(job)
+
+    def _finish_background_job(self, callback, payload):
+        self._background_job = None
+        if self._background_progress is not None:
+            self._background_progress.close()
+            self._background_progress = None
+        has_data = bool(self.summary_rows)
+        self.summary_csv_btn.setEnabled(has_data)
+        self.summary_excel_btn.setEnabled(has_data)
+        callback(payload)
 
     # ----------------------------------------------------------
     # Load all invoices or filtered by search
     # ----------------------------------------------------------
     def load_invoices(self):
-        query = self.search_input.text().strip()
-
-        if query:
-            invoices = self.db.search_invoices(query)
-        else:
-            invoices = self.db.get_invoices()
+        self.model.load(self.search_input.text().strip())
 
-        self.table.setRowCount(len(invoices))
-
-        for row, inv in enumerate(invoices):
-            self.table.setItem(row, 0, QTableWidgetItem(inv["invoice_no"]))
-            self.table.setItem(row, 1, QTableWidgetItem(inv.get("customer_name", "")))
-            self.table.setItem(row, 2, QTableWidgetItem(inv["date"]))
-            self.table.setItem(row, 3, QTableWidgetItem(str(inv["total_amount"])))
-            self.table.setItem(row, 4, QTableWidgetItem(inv.get("pdf_path", "")))
-
-            delete_btn = QPushButton("Delete")
-            delete_btn.setStyleSheet("color: white; background-color: #c0392b;")
-            delete_btn.clicked.connect(
-                lambda _, invoice_id=inv["id"]: self.delete_invoice(invoice_id)
-            )
-            self.table.setCellWidget(row, 5, delete_btn)
+    def refresh_invoices(self):
+        """Reload from the database, ignoring cached results."""
+        self.db.clear_invoice_cache()
+        self.load_invoices()
 
     # ----------------------------------------------------------
     # Open invoice PDF on double click
     # ----------------------------------------------------------
-    def on_row_double_clicked(self, item):
-        row = item.row()
-        pdf_path = self.table.item(row, 4).text()
+    def on_row_double_clicked(self, index):
+        if not index.isValid() or index.column() == InvoiceTableModel.ACTION_COLUMN:
+            return
+        pdf_path = self.model.invoice_at(index.row()).get("pdf_path", "")
 
         if not pdf_path:
             return
@@ -512,8 +842,10 @@ class ReportsView(QWidget):
 
         try:
             self.db.delete_invoice(invoice_id)
+            self._summary_cache.clear()
             QMessageBox.information(self, "Deleted", "Invoice deleted successfully.")
-            self.load_invoices()
+            if not self.model.remove_invoice(invoice_id):
+                self.load_invoices()
         except Exception as exc:
             QMessageBox.critical(
                 self,
@@ -1,6 +1,17 @@
 import os
-
-from PySide6.QtCore import Qt
+from functools import partial
+from pathlib import Path
+
+from PySide6.QtCore import (
+    Qt,
+    QObject,
+    QRegularExpression,
+    QRunnable,
+    QThreadPool,
+    QTimer,
+    Signal,
+)
+from PySide6.QtGui import QRegularExpressionValidator
 from PySide6.QtWidgets import (
     QWidget,
     QLabel,
@@ -16,11 +27,12 @@ from PySide6.QtWidgets import (
     QSpinBox,
     QCheckBox,
     QInputDialog,
+    QProgressDialog,
 )
 
-from src.backup import backup_database, regenerate_all_pdfs, restore_database
+from src.backup import backup_database, count_invoices, regenerate_all_pdfs, restore_database
 from src.import_export import (
-    export_to_csv,
+    export_to_csv_streaming,
     import_customers_from_csv,
     import_products_from_csv,
 )
@@ -34,18 +46,64 @@ from src.settings_manager import (
     set_app_password,
     is_password_protected,
     verify_app_password,
+    clear_settings_cache,
 )
 
 
+CSV_FILTER = "CSV Files (*.csv);;All Files (*)"
+DB_FILTER = "SQLite database (*.db);;All files (*)"
+# NTN: 7 to 13 digits, optionally dashed after the seventh (e.g. 1234567-8)
+NTN_RX = QRegularExpression(r"\d{7}(-?\d{1,6})?")
+
+
+class _TaskSignals(QObject):
+    progress = Signal(int)
+    done = Signal(object)
+    error = Signal(str)
+
+
+class CsvWorker(QRunnable):
+    """
+    Run an import/export/maintenance function on a pool thread. When
+    ``report_progress`` is set the function receives a ``progress``
+    callback that is forwarded to the UI through a signal.
+    """
+
+    def __init__(self, fn, *args, report_progress: bool = False):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.report_progress = report_progress
+        self.signals = _TaskSignals()
+
+    def run(self):
+        try:
+            if self.report_progress:
+                result = self.fn(*self.args, progress=self.signals.progress.emit)
+            else:
+                result = self.fn(*self.args)
+        except Exception as exc:
+            self.signals.error.emit(str(exc))
+            return
+        self.signals.done.emit(result)
+
+
 class SettingsForm(QWidget):
     """
     Screen that allows editing the company profile (used across invoices
     and reports) plus a handful of application-level preferences.
     """
 
+    # Resolved once when the class is defined
+    BACKUP_DIR = str(Path(__file__).resolve().parents[2] / "data" / "backups")
+
     def __init__(self):
         super().__init__()
         self.setObjectName("SettingsForm")
+        self._task = None
+        self._task_progress = None
+        self._pw_protected = is_password_protected()
+        self._file_dlg = None
         self._build_ui()
         self.load_data()
 
@@ -97,6 +155,8 @@ class SettingsForm(QWidget):
         self.address_input.setFixedHeight(70)
         self.contact_input = QLineEdit()
         self.ntn_input = QLineEdit()
+        self.ntn_input.setValidator(QRegularExpressionValidator(NTN_RX, self.ntn_input))
+        self.ntn_input.setPlaceholderText("e.g. 1234567-8")
         self.strn_input = QLineEdit()
 
         form.addRow("Legal Name*", self.name_input)
@@ -109,7 +169,12 @@ class SettingsForm(QWidget):
         save_btn.clicked.connect(self._on_save_company)
         save_btn.setDefault(True)
         self.company_refresh_btn = QPushButton("Reload")
-        self.company_refresh_btn.clicked.connect(self.load_data)
+        # Coalesce rapid clicks into a single reload
+        self._reload_timer = QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(250)
+        self._reload_timer.timeout.connect(self._do_load_data)
+        self.company_refresh_btn.clicked.connect(self._reload_timer.start)
 
         btn_row = QHBoxLayout()
         btn_row.addStretch()
@@ -233,11 +298,11 @@ class SettingsForm(QWidget):
         export_layout = QHBoxLayout()
         export_label = QLabel("Export Data (CSV):")
         export_cust_btn = QPushButton("Customers")
-        export_cust_btn.clicked.connect(lambda: self._on_export_data("customers"))
+        export_cust_btn.clicked.connect(partial(self._on_export_data, "customers"))
         export_prod_btn = QPushButton("Products")
-        export_prod_btn.clicked.connect(lambda: self._on_export_data("products"))
+        export_prod_btn.clicked.connect(partial(self._on_export_data, "products"))
         export_inv_btn = QPushButton("Invoices")
-        export_inv_btn.clicked.connect(lambda: self._on_export_data("invoices"))
+        export_inv_btn.clicked.connect(partial(self._on_export_data, "invoices"))
         
         export_layout.addWidget(export_label)
         export_layout.addWidget(export_cust_btn)
@@ -272,6 +337,8 @@ class SettingsForm(QWidget):
         self.address_input.setPlainText(profile.address)
         self.contact_input.setText(profile.contact)
         self.ntn_input.setText(profile.ntn)
+        # Stored NTNs predating the validator are kept as-is unless edited
+        self._loaded_ntn = (profile.ntn or "").strip()
         self.strn_input.setText(profile.strn)
 
         prefs = get_preferences()
@@ -279,8 +346,15 @@ class SettingsForm(QWidget):
         self.invoice_sequence_input.setValue(prefs.invoice_sequence)
         self.pdf_dir_input.setText(os.path.abspath(prefs.default_pdf_dir))
         self.auto_open_checkbox.setChecked(prefs.auto_open_pdf)
+        # Snapshot of the form as loaded, to skip saves that change nothing
+        self._loaded_prefs = self._collect_preferences()
         self._set_status("Loaded latest saved settings.")
 
+    def _do_load_data(self):
+        """Re-read settings from the database, bypassing the in-memory cache."""
+        clear_settings_cache()
+        self.load_data()
+
     def _collect_company_data(self) -> CompanyProfile:
         return CompanyProfile(
             name=self.name_input.text().strip(),
@@ -301,6 +375,15 @@ class SettingsForm(QWidget):
     def _on_save_company(self):
         try:
             profile = self._collect_company_data()
+            if (
+                profile.ntn
+                and profile.ntn != self._loaded_ntn
+                and not self.ntn_input.hasAcceptableInput()
+            ):
+                raise ValueError(
+                    f"NTN \"{profile.ntn}\" is not valid: use 7 to 13 digits, "
+                    "optionally with a dash after the seventh (e.g. 1234567-8)."
+                )
             save_company_profile(profile)
         except ValueError as exc:
             self._set_status(str(exc), error=True)
@@ -311,6 +394,7 @@ class SettingsForm(QWidget):
             QMessageBox.critical(self, "Unexpected Error", str(exc))
             return
 
+        self._loaded_ntn = profile.ntn
         self._set_status("Company profile saved.")
         QMessageBox.information(self, "Settings", "Company profile updated successfully.")
 
@@ -319,6 +403,9 @@ class SettingsForm(QWidget):
             prefs = self._collect_preferences()
             if not prefs.default_pdf_dir:
                 raise ValueError("Please select a PDF output folder.")
+            if prefs == self._loaded_prefs:
+                self._set_status("No changes.")
+                return
             save_preferences(prefs)
         except ValueError as exc:
             self._set_status(str(exc), error=True)
@@ -329,38 +416,113 @@ class SettingsForm(QWidget):
             QMessageBox.critical(self, "Unexpected Error", str(exc))
             return
 
+        self._loaded_prefs = prefs
         self._set_status("Preferences saved.")
         QMessageBox.information(self, "Settings", "Preferences updated successfully.")
 
     # ------------------------------------------------------------------ #
     # Helpers
     # ------------------------------------------------------------------ #
+    def _ask_path(self, title: str, mode=QFileDialog.ExistingFile, save: bool = False,
+                  name_filter: str = "", directory: str = "", select: str = "") -> str:
+        """
+        Show the form's single, reused QFileDialog configured for this request
+        and return the chosen path (or "" when cancelled).
+        """
+        if self._file_dlg is None:
+            self._file_dlg = QFileDialog(self)
+        dlg = self._file_dlg
+        dlg.setWindowTitle(title)
+        dlg.setAcceptMode(QFileDialog.AcceptSave if save else QFileDialog.AcceptOpen)
+        dlg.setFileMode(mode)
+        dlg.setOption(QFileDialog.ShowDirsOnly, mode == QFileDialog.Directory)
+        dlg.setNameFilters(name_filter.split(";;") if name_filter else [])
+        if directory:
+            dlg.setDirectory(directory)
+        dlg.selectFile(select)
+
+        if not dlg.exec():
+            return ""
+        selected = dlg.selectedFiles()
+        return selected[0] if selected else ""
+
     def _browse_pdf_dir(self):
+        # The field only ever holds absolute paths (normalised in load_data,
+        # or straight from the dialog), so no abspath round-trips here.
         start_dir = self.pdf_dir_input.text() or os.getcwd()
-        selected = QFileDialog.getExistingDirectory(
-            self,
+        selected = self._ask_path(
             "Select PDF output folder",
-            os.path.abspath(start_dir),
+            QFileDialog.Directory,
+            directory=start_dir,
         )
         if selected:
-            self.pdf_dir_input.setText(os.path.abspath(selected))
+            self.pdf_dir_input.setText(selected)
 
     def _set_status(self, message: str, error: bool = False):
         color = "#c62828" if error else "#2e7d32"
         self.status_label.setStyleSheet(f"color: {color}; font-weight: 500;")
         self.status_label.setText(message)
 
+    def _run_task(self, worker: CsvWorker, label: str, on_done, on_error, total: int = 0):
+        """
+        Start ``worker`` on the global thread pool behind a modal progress
+        dialog (busy indicator when ``total`` is 0). The data and I/O groups
+        are disabled until the worker reports back.
+        """
+        self.data_group.setEnabled(False)
+        self.io_group.setEnabled(False)
+
+        progress = QProgressDialog(label, None, 0, total, self)
+        progress.setWindowTitle("Please wait")
+        progress.setWindowModality(Qt.WindowModal)
+        progress.setMinimumDuration(0)
+        progress.setValue(0)
+        progress.show()
+        self._task_progress = progress
+
+        if total:
+            worker.signals.progress.connect(progress.setValue)
+        worker.signals.done.connect(partial(self._finish_task, on_done))
+        worker.signals.error.connect(partial(self._finish_task, on_error))
+        self._task = worker
+        QThreadPool.globalInstance().start(worker)
+
+    def _finish_task(self, callback, payload):
+        self._task = None
+        if self._task_progress is not None:
+            self._task_progress.close()
+            self._task_progress = None
+        self.data_group.setEnabled(True)
+        self.io_group.setEnabled(True)
+        callback(payload)
+
+    @staticmethod
+    def _count_csv_rows(path: str) -> int:
+        """Number of data rows (lines minus the header) for the progress bar."""
+        lines = 0
+        last = b""
+        with open(path, "rb") as f:
+            # bytes.count scans each 1 MB block in C
+            for block in iter(partial(f.read, 1 << 20), b""):
+                lines += block.count(b"\n")
+                last = block
+        if last and not last.endswith(b"\n"):
+            lines += 1  # last line without a trailing newline
+        return max(lines - 1, 0)
+
     # ------------------------------------------------------------------ #
     # Data maintenance actions
     # ------------------------------------------------------------------ #
     def _on_backup_database(self):
-        try:
-            backup_path = backup_database()
-        except Exception as exc:  # pragma: no cover - I/O heavy
-            QMessageBox.critical(self, "Backup Failed", str(exc))
-            self._set_status("Backup failed.", error=True)
-            return
+        self._run_task(
+            CsvWorker(backup_database, report_progress=True),
+            "Backing up database…",
+            self._on_backup_done,
+            self._on_backup_failed,
+            total=100,
+        )
 
+    def _on_backup_done(self, backup_path: str):
         self._set_status("Database backup completed.")
         QMessageBox.information(
             self,
@@ -368,13 +530,15 @@ class SettingsForm(QWidget):
             f"A backup was saved to:\n{backup_path}",
         )
 
+    def _on_backup_failed(self, message: str):
+        QMessageBox.critical(self, "Backup Failed", message)
+        self._set_status("Backup failed.", error=True)
+
     def _on_restore_database(self):
-        start_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "data", "backups"))
-        path, _ = QFileDialog.getOpenFileName(
-            self,
+        path = self._ask_path(
             "Select backup file",
-            start_dir,
-            "SQLite database (*.db);;All files (*)",
+            name_filter=DB_FILTER,
+            directory=self.BACKUP_DIR,
         )
         if not path:
             return
@@ -391,6 +555,7 @@ class SettingsForm(QWidget):
 
         try:
             restore_database(path)
+            clear_settings_cache()
         except Exception as exc:  # pragma: no cover - I/O heavy
             QMessageBox.critical(self, "Restore Failed", str(exc))
             self._set_status("Restore failed.", error=True)
@@ -405,21 +570,23 @@ class SettingsForm(QWidget):
 
     def _on_regenerate_pdfs(self):
         start_dir = self.pdf_dir_input.text().strip() or os.getcwd()
-        output_dir = QFileDialog.getExistingDirectory(
-            self,
+        output_dir = self._ask_path(
             "Select folder for regenerated PDFs",
-            os.path.abspath(start_dir),
+            QFileDialog.Directory,
+            directory=start_dir,
         )
         if not output_dir:
             return
 
-        try:
-            pdf_paths = regenerate_all_pdfs(output_dir)
-        except Exception as exc:  # pragma: no cover - heavy I/O
-            QMessageBox.critical(self, "Regeneration Failed", str(exc))
-            self._set_status("PDF regeneration failed.", error=True)
-            return
+        self._run_task(
+            CsvWorker(regenerate_all_pdfs, output_dir, report_progress=True),
+            "Regenerating invoice PDFs…",
+            partial(self._on_regenerate_done, output_dir),
+            self._on_regenerate_failed,
+            total=count_invoices(),
+        )
 
+    def _on_regenerate_done(self, output_dir: str, pdf_paths):
         self._set_status("PDF regeneration complete.")
         QMessageBox.information(
             self,
@@ -427,11 +594,15 @@ class SettingsForm(QWidget):
             f"Regenerated {len(pdf_paths)} invoices into:\n{output_dir}",
         )
 
+    def _on_regenerate_failed(self, message: str):
+        QMessageBox.critical(self, "Regeneration Failed", message)
+        self._set_status("PDF regeneration failed.", error=True)
+
     # ------------------------------------------------------------------ #
     # Security actions
     # ------------------------------------------------------------------ #
     def _update_password_status(self):
-        if is_password_protected():
+        if self._pw_protected:
             self.password_status_label.setText("Status: Password Protected 🔒")
             self.password_status_label.setStyleSheet("color: green; font-weight: bold;")
         else:
@@ -440,7 +611,7 @@ class SettingsForm(QWidget):
 
     def _on_change_password(self):
         # If currently protected, ask for old password
-        if is_password_protected():
+        if self._pw_protected:
             old_pw, ok = QInputDialog.getText(self, "Security", "Enter current password:", QLineEdit.Password)
             if not ok:
                 return
@@ -461,6 +632,7 @@ class SettingsForm(QWidget):
                 return
         
         set_app_password(new_pw)
+        self._pw_protected = bool(new_pw)
         self._update_password_status()
         msg = "Password updated." if new_pw else "Password removed."
         self._set_status(msg)
@@ -469,57 +641,66 @@ class SettingsForm(QWidget):
     # ------------------------------------------------------------------ #
     # Import / Export actions
     # ------------------------------------------------------------------ #
-    def _on_export_data(self, table_name: str):
-        path, _ = QFileDialog.getSaveFileName(
-            self,
+    def _on_export_data(self, table_name: str, _checked: bool = False):
+        path = self._ask_path(
             f"Export {table_name.capitalize()}",
-            f"{table_name}.csv",
-            "CSV Files (*.csv);;All Files (*)"
+            QFileDialog.AnyFile,
+            save=True,
+            name_filter=CSV_FILTER,
+            select=f"{table_name}.csv",
         )
         if not path:
             return
             
-        try:
-            export_to_csv(table_name, path)
-            self._set_status(f"Exported {table_name} successfully.")
-            QMessageBox.information(self, "Export", f"Successfully exported {table_name} to {path}")
-        except Exception as e:
-            self._set_status(f"Export failed: {e}", error=True)
-            QMessageBox.critical(self, "Export Failed", str(e))
+        self._run_task(
+            CsvWorker(export_to_csv_streaming, table_name, path),
+            f"Exporting {table_name}…",
+            partial(self._on_export_done, table_name, path),
+            self._on_export_failed,
+        )
+
+    def _on_export_done(self, table_name: str, path: str, _result):
+        self._set_status(f"Exported {table_name} successfully.")
+        QMessageBox.information(self, "Export", f"Successfully exported {table_name} to {path}")
+
+    def _on_export_failed(self, message: str):
+        self._set_status(f"Export failed: {message}", error=True)
+        QMessageBox.critical(self, "Export Failed", message)
 
     def _on_import_customers(self):
-        path, _ = QFileDialog.getOpenFileName(
-            self,
-            "Import Customers CSV",
-            "",
-            "CSV Files (*.csv);;All Files (*)"
-        )
+        path = self._ask_path("Import Customers CSV", name_filter=CSV_FILTER)
         if not path:
             return
-            
-        try:
-            count = import_customers_from_csv(path)
-            self._set_status(f"Imported {count} customers.")
-            QMessageBox.information(self, "Import", f"Successfully imported/updated {count} customers.")
-        except Exception as e:
-            self._set_status(f"Import failed: {e}", error=True)
-            QMessageBox.critical(self, "Import Failed", str(e))
+
+        self._start_import(import_customers_from_csv, path, "customers")
 
     def _on_import_products(self):
-        path, _ = QFileDialog.getOpenFileName(
-            self,
-            "Import Products CSV",
-            "",
-            "CSV Files (*.csv);;All Files (*)"
-        )
+        path = self._ask_path("Import Products CSV", name_filter=CSV_FILTER)
         if not path:
             return
-            
+
+        self._start_import(import_products_from_csv, path, "products")
+
+    def _start_import(self, import_fn, path: str, kind: str):
         try:
-            count = import_products_from_csv(path)
-            self._set_status(f"Imported {count} products.")
-            QMessageBox.information(self, "Import", f"Successfully imported/updated {count} products.")
+            total = self._count_csv_rows(path)
         except Exception as e:
-            self._set_status(f"Import failed: {e}", error=True)
-            QMessageBox.critical(self, "Import Failed", str(e))
+            self._on_import_failed(str(e))
+            return
+
+        self._run_task(
+            CsvWorker(import_fn, path, report_progress=True),
+            f"Importing {kind}…",
+            partial(self._on_import_done, kind),
+            self._on_import_failed,
+            total=total,
+        )
+
+    def _on_import_done(self, kind: str, count: int):
+        self._set_status(f"Imported {count} {kind}.")
+        QMessageBox.information(self, "Import", f"Successfully imported/updated {count} {kind}.")
 
+    def _on_import_failed(self, message: str):
+        # Imports run in a single transaction, so a failure leaves the data untouched
+        self._set_status(f"Import failed: {message}", error=True)
+        QMessageBox.critical(self, "Import Failed", f"{message}\n\nNo rows were imported.")
@@ -3,6 +3,7 @@ from decimal import Decimal
 from src.calculations import (
     calculate_item,
     summarize_invoice,
+    summarize_invoice_bulk,
     generate_next_invoice_number,
     _money,
 )
@@ -33,6 +34,14 @@ class TestCalculations(unittest.TestCase):
         self.assertEqual(summary["grand_total"], Decimal("2370.00"))
         self.assertEqual(summary["total_qty_pieces"], 15)
 
+    def test_summarize_invoice_bulk(self):
+        qtys = [10, 5, 3, 240, "2.5", 7]
+        prices = [100, 200, "19.99", 700, "2.675", 0.125]
+        expected = summarize_invoice(
+            [calculate_item(q, p) for q, p in zip(qtys, prices)]
+        )
+        self.assertEqual(summarize_invoice_bulk(qtys, prices), expected)
+
     def test_invoice_number(self):
         self.assertEqual(generate_next_invoice_number("214"), "215")
         self.assertEqual(generate_next_invoice_number("INV-0059"), "INV-0060")
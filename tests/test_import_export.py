@@ -0,0 +1,78 @@
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+
+import src.import_export as import_export
+from src.db import Database
+from src.import_export import CsvImportError, import_products_from_csv
+
+
+class TestProductImport(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db_file = os.path.join(self.tmp_dir, "invoices.db")
+        db = Database(self.db_file)  # creates the schema
+        db.execute("INSERT INTO products (name, unit_price) VALUES (?, ?)", ("Old", 1.0))
+        db.close()
+
+        self._orig_db_file = import_export.DB_FILE
+        import_export.DB_FILE = self.db_file
+
+    def tearDown(self):
+        import_export.DB_FILE = self._orig_db_file
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _write_csv(self, text):
+        path = os.path.join(self.tmp_dir, "products.csv")
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            f.write(text)
+        return path
+
+    def _products(self):
+        with sqlite3.connect(self.db_file) as conn:
+            return conn.execute(
+                "SELECT name, unit_price, tax_rate FROM products ORDER BY id"
+            ).fetchall()
+
+    def test_bad_row_rolls_back_whole_file(self):
+        path = self._write_csv(
+            "name,unit_price\n"
+            "Old,5\n"
+            "New,2\n"
+            "Bad,abc\n"
+        )
+        with self.assertRaises(CsvImportError) as ctx:
+            import_products_from_csv(path)
+
+        self.assertEqual(ctx.exception.line, 4)
+        self.assertTrue(str(ctx.exception).startswith("Row 4:"))
+        # Neither the update of "Old" nor the insert of "New" was kept
+        self.assertEqual(self._products(), [("Old", 1.0, 18.0)])
+
+    def test_blank_is_zero_and_repeated_names_insert_once(self):
+        path = self._write_csv(
+            "name,unit_price,tax_rate\n"
+            "Widget,,\n"
+            "Gadget,3,17\n"
+            "Widget,7,\n"
+            "Old,4,\n"
+            "Blank,,\n"
+        )
+        count = import_products_from_csv(path)
+
+        self.assertEqual(count, 5)
+        self.assertEqual(
+            self._products(),
+            [
+                ("Old", 4.0, 0.0),
+                ("Widget", 7.0, 0.0),  # last occurrence wins
+                ("Gadget", 3.0, 17.0),
+                ("Blank", 0.0, 0.0),
+            ],
+        )
+
+if __name__ == "__main__":
+    unittest.main()